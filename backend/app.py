@@ -1,7 +1,10 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from backend.base import SessionLocal, Base, engine
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, configure_mappers
+from backend.base import SessionLocal, Base, DBSessionMiddleware, async_engine, engine
+from backend.request_cache import RequestCacheMiddleware
 from backend.routes import (
     business_routes, 
     category_routes, 
@@ -16,7 +19,23 @@ from backend.routes import (
 
 Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="MicroAnalitycs", debug=True)
+# Resuelve ahora las relaciones declaradas por nombre ("Business", "TransactionDetail"...);
+# si no, SQLAlchemy lo hace en la primera consulta y esa petición paga el coste
+configure_mappers()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Precalienta el caché de predicciones de los productos más vendidos al arrancar"""
+    await prediction_routes.warm_prediction_cache()
+    yield
+
+# ORJSONResponse como respuesta por defecto: codificación JSON en C (orjson)
+app = FastAPI(
+    title="MicroAnalitycs",
+    debug=True,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
 
 # Configurar CORS para permitir conexiones desde el frontend
 app.add_middleware(
@@ -27,6 +46,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Caché de lecturas por clave primaria con alcance de petición
+app.add_middleware(RequestCacheMiddleware)
+
+# Una sesión de base de datos por petición, liberada al terminar la respuesta
+app.add_middleware(DBSessionMiddleware)
+
 
 app.include_router(
     business_routes.router,
@@ -94,6 +119,14 @@ async def chatbot_message(message: dict):
     except Exception as e:
         return {"error": str(e), "message": "Error procesando mensaje"}
 
+@app.get("/healthz/pool")
+async def pool_health():
+    """Estado de los pools de conexiones a la base de datos"""
+    return {
+        "sync": engine.pool.status(),
+        "async": async_engine.pool.status()
+    }
+
 @app.get("/api/chatbot/health")
 async def chatbot_health():
     """Check chatbot health"""
@@ -1,20 +1,133 @@
+from contextvars import ContextVar
+from typing import Optional
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import scoped_session, sessionmaker, declarative_base
+from starlette.concurrency import run_in_threadpool
 import os
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./database.db")  # Fixed absolute path
 
+# Drivers asíncronos equivalentes a los síncronos para AsyncSession
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+def _to_async_url(url: str) -> str:
+    scheme, sep, rest = url.partition("://")
+    return f"{_ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", _to_async_url(DATABASE_URL))
+
+# Entradas de la caché de SQL compilado por engine (SQLAlchemy usa 500 por defecto)
+QUERY_CACHE_SIZE = 1200
+
+# Pool compartido por ambos engines: 20 conexiones + 10 de desborde; si el pool
+# está agotado se falla a los 5 s en lugar de encolar peticiones 30 s
+POOL_OPTIONS = {
+    "pool_size": 20,
+    "max_overflow": 10,
+    "pool_timeout": 5,
+    "pool_pre_ping": True,
+    "pool_recycle": 3600,
+}
+
+# Detrás de PgBouncer en modo transacción el pooler ya multiplexa las conexiones:
+# el pool local se reduce y no se usan prepared statements ni parámetros de
+# arranque (no se conservan entre transacciones de servidor distintas)
+USE_PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() in ("1", "true", "yes")
+if USE_PGBOUNCER:
+    POOL_OPTIONS.update(pool_size=5, max_overflow=0)
+
+# Opciones exclusivas de QueuePool: SQLite en memoria usa SingletonThreadPool
+# (o StaticPool con aiosqlite), que las rechaza con TypeError
+_QUEUE_POOL_ONLY = ("pool_size", "max_overflow", "pool_timeout")
+
+def _pool_options(url: str) -> dict:
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        database = parsed.database or ""
+        if database in ("", ":memory:") or parsed.query.get("mode") == "memory":
+            return {k: v for k, v in POOL_OPTIONS.items() if k not in _QUEUE_POOL_ONLY}
+    return POOL_OPTIONS
+
+# Límite de duración por sentencia (sólo PostgreSQL admite statement_timeout)
+STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "10000"))
+
+def _connect_args(url: str) -> dict:
+    if url.startswith("sqlite"):
+        return {"check_same_thread": False}
+    if USE_PGBOUNCER:
+        # statement_timeout se fija en el servidor PostgreSQL (ver docker-compose.yml)
+        if url.startswith("postgresql+asyncpg"):
+            return {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        return {}
+    if url.startswith("postgresql+asyncpg"):
+        return {"server_settings": {"statement_timeout": str(STATEMENT_TIMEOUT_MS)}}
+    if url.startswith("postgresql"):
+        return {"options": f"-c statement_timeout={STATEMENT_TIMEOUT_MS}"}
+    return {}
+
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+    connect_args=_connect_args(DATABASE_URL),
+    query_cache_size=QUERY_CACHE_SIZE,
+    **_pool_options(DATABASE_URL)
+)
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    connect_args=_connect_args(ASYNC_DATABASE_URL),
+    query_cache_size=QUERY_CACHE_SIZE,
+    **_pool_options(ASYNC_DATABASE_URL)
 )
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
+# Registro de sesiones con alcance de petición HTTP. El ámbito es un ContextVar
+# (no el hilo), porque FastAPI puede ejecutar la dependencia y la ruta síncrona
+# en hilos distintos del threadpool; el contexto sí se propaga entre ambos
+_db_scope: ContextVar[Optional[object]] = ContextVar("db_scope", default=None)
+SessionRegistry = scoped_session(SessionLocal, scopefunc=_db_scope.get)
+
+
+class DBSessionMiddleware:
+    """Middleware ASGI que abre un ámbito de sesión por petición y lo libera al final."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = _db_scope.set(object())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if SessionRegistry.registry.has():
+                await run_in_threadpool(SessionRegistry.remove)
+            _db_scope.reset(token)
+
+
 def get_db():
-    db = SessionLocal()
-    try:
+    # Fuera de una petición (scripts, tests) se usa una sesión propia
+    if _db_scope.get() is None:
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+        return
+    # Dentro de una petición todas las dependencias comparten la sesión del
+    # registro; DBSessionMiddleware la cierra con SessionRegistry.remove()
+    yield SessionRegistry()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -1,7 +1,9 @@
 from typing import Optional
+from sqlalchemy import delete, select, update
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Session, joinedload
 from backend.models.inventory import Inventory
+from backend.models.product import Product
 from backend.schemas.inventory_schema import (
     InventoryCreate,
     InventoryUpdate,
@@ -45,55 +47,66 @@ def create_inventory(db: Session, inventory: InventoryCreate) -> InventoryRead:
     db.refresh(db_inventory)
     return InventoryRead.model_validate(db_inventory)
 
-# Actualiza un registro de inventario existente
+# Actualiza un registro de inventario existente (UPDATE ... RETURNING)
 def update_inventory(
     db: Session, 
     inventory_id: int, 
     inventory: InventoryUpdate
 ) -> InventoryRead | None:
     """Actualiza un registro de inventario"""
-    db_inventory = db.query(Inventory).filter(Inventory.id == inventory_id).first()
-    if not db_inventory:
-        return None
-    
     update_data = inventory.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_inventory, field, value)
     
     # Actualiza automáticamente la fecha
-    db_inventory.ultimo_ingreso = func.now()
+    update_data["ultimo_ingreso"] = func.now()
+    
+    db_inventory = db.execute(
+        update(Inventory)
+        .where(Inventory.id == inventory_id)
+        .values(**update_data)
+        .returning(Inventory)
+    ).scalar_one_or_none()
+    if not db_inventory:
+        return None
     
+    result = InventoryRead.model_validate(db_inventory)
     db.commit()
-    db.refresh(db_inventory)
-    return InventoryRead.model_validate(db_inventory)
+    return result
 
 # Elimina un registro de inventario por su ID
 def delete_inventory(db: Session, inventory_id: int) -> dict:
     """Elimina un registro de inventario y retorna un diccionario con los datos básicos"""
-    # Cargamos el inventario con la relación producto usando joinedload
-    db_inventory = (
-        db.query(Inventory)
-        .options(joinedload(Inventory.producto))
-        .filter(Inventory.id == inventory_id)
-        .first()
+    # DELETE ... RETURNING con el nombre del producto como subconsulta escalar
+    product_name = (
+        select(Product.nombre)
+        .where(Product.id == Inventory.product_id)
+        .scalar_subquery()
     )
+    deleted = db.execute(
+        delete(Inventory)
+        .where(Inventory.id == inventory_id)
+        .returning(
+            Inventory.id,
+            Inventory.product_id,
+            Inventory.stock_actual,
+            Inventory.ultimo_ingreso,
+            product_name.label("product_name")
+        )
+    ).first()
     
-    if not db_inventory:
+    if not deleted:
         return None
     
-    # Preparamos los datos antes de eliminar
+    db.commit()
+    
     result = {
-        "id": db_inventory.id,
-        "product_id": db_inventory.product_id,
-        "stock_actual": db_inventory.stock_actual,
-        "ultimo_ingreso": db_inventory.ultimo_ingreso.isoformat() if db_inventory.ultimo_ingreso else None
+        "id": deleted.id,
+        "product_id": deleted.product_id,
+        "stock_actual": deleted.stock_actual,
+        "ultimo_ingreso": deleted.ultimo_ingreso.isoformat() if deleted.ultimo_ingreso else None
     }
     
-    # Si el producto está cargado, añadimos su nombre
-    if db_inventory.producto:
-        result["product_name"] = db_inventory.producto.nombre
-    
-    db.delete(db_inventory)
-    db.commit()
+    # Si el producto existe, añadimos su nombre
+    if deleted.product_name is not None:
+        result["product_name"] = deleted.product_name
     
     return result
\ No newline at end of file
@@ -1,3 +1,4 @@
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import joinedload
 from backend.models.product import Product
@@ -43,10 +44,13 @@ def get_product_with_relations(db: Session, product_id: int):
     
     return ProductWithRelations.model_validate(product_data)
 
-# Obtiene una lista de productos con paginación
-def get_products(db: Session, skip: int = 0, limit: int = 100) -> list[ProductRead]:
+# Obtiene una lista de productos con paginación y filtrado opcional por ID de negocio
+def get_products(db: Session, skip: int = 0, limit: int = 100, business_id: int | None = None) -> list[ProductRead]:
    
-    return [ProductRead.model_validate(p) for p in db.query(Product).offset(skip).limit(limit).all()]
+    query = db.query(Product)
+    if business_id:
+        query = query.filter(Product.business_id == business_id)
+    return [ProductRead.model_validate(p) for p in query.offset(skip).limit(limit).all()]
 
 # Crea un nuevo producto en la base de datos y retorna el producto creado
 def create_product(db: Session, product: ProductCreate) -> ProductRead:
@@ -57,21 +61,25 @@ def create_product(db: Session, product: ProductCreate) -> ProductRead:
     db.refresh(db_product)  
     return ProductRead.model_validate(db_product)
 
-# Actualiza un producto existente (actualización parcial)
+# Actualiza un producto existente (actualización parcial, UPDATE ... RETURNING)
 def update_product(db: Session, product_id: int, product: ProductUpdate) -> ProductRead | None:
 
-    db_product = db.query(Product).filter(Product.id == product_id).first()
+    update_data = product.model_dump(exclude_unset=True)
+    if not update_data:
+        return get_product(db, product_id)
+    
+    db_product = db.execute(
+        update(Product)
+        .where(Product.id == product_id)
+        .values(**update_data)
+        .returning(Product)
+    ).scalar_one_or_none()
     if not db_product:
         return None
     
-   
-    update_data = product.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_product, field, value)
-    
+    result = ProductRead.model_validate(db_product)
     db.commit()
-    db.refresh(db_product)
-    return ProductRead.model_validate(db_product)
+    return result
 
 # Elimina un producto por su ID
 def delete_product(db: Session, product_id: int) -> ProductRead | None:
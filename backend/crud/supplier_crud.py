@@ -1,5 +1,7 @@
+from sqlalchemy import delete, update
 from sqlalchemy.orm import Session
 from backend.models.supplier import Supplier
+from backend.models.supplier_price import SupplierPrice
 from backend.schemas.supplier_schema import (
     SupplierCreate,
     SupplierUpdate,
@@ -31,31 +33,47 @@ def create_supplier(db: Session, supplier: SupplierCreate) -> SupplierRead:
     db.refresh(db_supplier)
     return SupplierRead.model_validate(db_supplier, from_attributes=True)
 
-# Actualiza un proveedor existente 
+# Actualiza un proveedor existente (UPDATE ... RETURNING)
 def update_supplier(
     db: Session, 
     supplier_id: int, 
     supplier: SupplierUpdate
 ) -> SupplierRead | None:
-    db_supplier = db.query(Supplier).filter(Supplier.id == supplier_id).first()
+    update_data = supplier.model_dump(exclude_unset=True)
+    if not update_data:
+        return get_supplier(db, supplier_id)
+    
+    db_supplier = db.execute(
+        update(Supplier)
+        .where(Supplier.id == supplier_id)
+        .values(**update_data)
+        .returning(Supplier)
+    ).scalar_one_or_none()
     if not db_supplier:
         return None
     
-    update_data = supplier.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_supplier, field, value)
-    
+    result = SupplierRead.model_validate(db_supplier, from_attributes=True)
     db.commit()
-    db.refresh(db_supplier)
-    return SupplierRead.model_validate(db_supplier, from_attributes=True)
+    return result
 
-# Elimina un proveedor por su ID 
+# Elimina un proveedor por su ID (DELETE ... RETURNING)
 def delete_supplier(db: Session, supplier_id: int) -> SupplierRead | None:
     
-    db_supplier = db.query(Supplier).filter(Supplier.id == supplier_id).first()
+    # Igual que el borrado ORM: los precios asociados quedan sin proveedor
+    db.execute(
+        update(SupplierPrice)
+        .where(SupplierPrice.supplier_id == supplier_id)
+        .values(supplier_id=None)
+    )
+    db_supplier = db.execute(
+        delete(Supplier)
+        .where(Supplier.id == supplier_id)
+        .returning(Supplier)
+    ).scalar_one_or_none()
     if not db_supplier:
+        db.rollback()
         return None
     
-    db.delete(db_supplier)
+    result = SupplierRead.model_validate(db_supplier, from_attributes=True)
     db.commit()
-    return SupplierRead.model_validate(db_supplier, from_attributes=True)
\ No newline at end of file
+    return result
\ No newline at end of file
@@ -1,3 +1,4 @@
+from sqlalchemy import delete, update
 from sqlalchemy.orm import Session, joinedload
 from typing import Optional
 from backend.models.supplier_price import SupplierPrice
@@ -76,33 +77,42 @@ def create_supplier_price(db: Session, price: SupplierPriceCreate) -> SupplierPr
     db.refresh(db_price)
     return SupplierPriceRead.model_validate(db_price)
 
-# Actualiza un precio de proveedor existente en la base de datos
+# Actualiza un precio de proveedor existente en la base de datos (UPDATE ... RETURNING)
 def update_supplier_price(
     db: Session,
     price_id: int,
     price: SupplierPriceUpdate
 ) -> Optional[SupplierPriceRead]:
-    db_price = db.query(SupplierPrice).filter(SupplierPrice.id == price_id).first()
+    update_data = price.model_dump(exclude_unset=True)
+    if not update_data:
+        return get_supplier_price(db, price_id)
+    
+    db_price = db.execute(
+        update(SupplierPrice)
+        .where(SupplierPrice.id == price_id)
+        .values(**update_data)
+        .returning(SupplierPrice)
+    ).scalar_one_or_none()
     if not db_price:
         return None
     
-    update_data = price.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_price, field, value)
-    
+    result = SupplierPriceRead.model_validate(db_price)
     db.commit()
-    db.refresh(db_price)
-    return SupplierPriceRead.model_validate(db_price)
+    return result
 
-# Elimina un precio de proveedor por su ID
+# Elimina un precio de proveedor por su ID (DELETE ... RETURNING)
 def delete_supplier_price(db: Session, price_id: int) -> Optional[SupplierPriceRead]:
-    db_price = db.query(SupplierPrice).filter(SupplierPrice.id == price_id).first()
+    db_price = db.execute(
+        delete(SupplierPrice)
+        .where(SupplierPrice.id == price_id)
+        .returning(SupplierPrice)
+    ).scalar_one_or_none()
     if not db_price:
         return None
     
-    db.delete(db_price)
+    result = SupplierPriceRead.model_validate(db_price)
     db.commit()
-    return SupplierPriceRead.model_validate(db_price)
+    return result
 
 # Obtiene todos los precios de proveedores con relaciones cargadas y paginación
 # En backend/crud/supplier_price_crud.py
@@ -1,6 +1,10 @@
-from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
+from pydantic import TypeAdapter
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from typing import AsyncIterator, List, Optional
 from backend.models.transaction import Transaction
+from backend.request_cache import clear_request_cache, request_cached
 from backend.schemas.transaction_schema import (
     TransactionCreate,
     TransactionRead,
@@ -8,81 +12,132 @@ from backend.schemas.transaction_schema import (
     TransactionWithRelations
 )
 
+# Sentencias base construidas una sola vez; los filtros y la paginación se
+# añaden como parámetros, así la clave de la caché de SQL compilado es estable
+_SELECT_TRANSACTIONS = select(Transaction)
+_SELECT_TRANSACTION_WITH_RELATIONS = select(Transaction).options(
+    joinedload(Transaction.business),
+    selectinload(Transaction.detalles)
+)
+
+# Validador compilado una sola vez: convierte la lista de filas ORM en una llamada
+_TRANSACTION_LIST_ADAPTER = TypeAdapter(List[TransactionRead])
+
 #obtiene una transacción por ID
-def get_transaction(db: Session, transaction_id: int) -> Optional[TransactionRead]:
-    db_transaction = db.query(Transaction).filter(Transaction.id == transaction_id).first()
+@request_cached
+async def get_transaction(db: AsyncSession, transaction_id: int) -> Optional[TransactionRead]:
+    db_transaction = await db.get(Transaction, transaction_id)
     return TransactionRead.model_validate(db_transaction) if db_transaction else None
 
 # Obtiene una transacción con sus relaciones (negocio y detalles)
-def get_transaction_with_relations(db: Session, transaction_id: int) -> Optional[TransactionWithRelations]:
-    db_transaction = (
-        db.query(Transaction)
-        .options(
-            joinedload(Transaction.business),
-            joinedload(Transaction.detalles)
-        )
-        .filter(Transaction.id == transaction_id)
-        .first()
+# El negocio (to-one) va en el mismo SELECT con JOIN; los detalles (one-to-many)
+# se cargan con un único SELECT ... WHERE transaction_id IN (...) adicional
+@request_cached
+async def get_transaction_with_relations(db: AsyncSession, transaction_id: int) -> Optional[TransactionWithRelations]:
+    result = await db.execute(
+        _SELECT_TRANSACTION_WITH_RELATIONS.where(Transaction.id == transaction_id)
     )
+    db_transaction = result.scalars().first()
     
     if not db_transaction:
         return None
     
+    # Los detalles se pasan como objetos ORM: pydantic-core los lee por atributos
+    # (from_attributes) en Rust, sin construir un dict por fila en Python
     transaction_data = {
-        **db_transaction.__dict__,
+        "id": db_transaction.id,
+        "business_id": db_transaction.business_id,
+        "total": db_transaction.total,
+        "fecha": db_transaction.fecha,
         "business": {
             "id": db_transaction.business.id,
             "nombre": db_transaction.business.nombre
         } if db_transaction.business else None,
-        "detalles": [
-            {
-                "id": detalle.id,
-                "product_id": detalle.product_id,
-                "cantidad": detalle.cantidad,
-                "precio_unitario": float(detalle.precio_unitario)
-            }
-            for detalle in db_transaction.detalles
-        ]
+        "detalles": db_transaction.detalles
     }
     
-    transaction_data.pop('_sa_instance_state', None)
-    if transaction_data['business']:
-        transaction_data['business'].pop('_sa_instance_state', None)
-    
     return TransactionWithRelations.model_validate(transaction_data)
 
-#Obtiene una lista de transacciones con paginación y filtrado opcional por ID de negocio
-def get_transactions(
-    db: Session,
-    skip: int = 0,
+# Construye la consulta de una página por cursor (keyset): las más recientes primero
+def _transactions_page_stmt(cursor: Optional[int], limit: int, business_id: Optional[int]):
+    stmt = _SELECT_TRANSACTIONS
+    
+    if business_id:
+        stmt = stmt.where(Transaction.business_id == business_id)
+    if cursor is not None:
+        stmt = stmt.where(Transaction.id < cursor)
+    
+    return stmt.order_by(Transaction.id.desc()).limit(limit)
+
+#Obtiene una lista de transacciones con paginación por cursor (keyset) y filtrado opcional por ID de negocio
+#Devuelve las transacciones más recientes primero; `cursor` es el último ID de la página anterior
+async def get_transactions(
+    db: AsyncSession,
+    cursor: Optional[int] = None,
     limit: int = 1000,
     business_id: Optional[int] = None
 ) -> List[TransactionRead]:
-    query = db.query(Transaction)
+    result = await db.execute(_transactions_page_stmt(cursor, limit, business_id))
+    return _TRANSACTION_LIST_ADAPTER.validate_python(
+        result.scalars().all(),
+        from_attributes=True
+    )
+
+# Itera una página de transacciones leyendo del cursor por lotes (yield_per)
+async def iter_transactions(
+    db: AsyncSession,
+    cursor: Optional[int] = None,
+    limit: int = 1000,
+    business_id: Optional[int] = None,
+    batch_size: int = 1000
+) -> AsyncIterator[TransactionRead]:
+    stmt = _transactions_page_stmt(cursor, limit, business_id)
+    result = await db.stream_scalars(stmt.execution_options(yield_per=batch_size))
+    async for transaction in result:
+        yield TransactionRead.model_validate(transaction)
+
+# Cuenta las transacciones (opcionalmente de un negocio) con COUNT en SQL
+async def count_transactions(db: AsyncSession, business_id: Optional[int] = None) -> int:
+    stmt = select(func.count()).select_from(Transaction)
     
     if business_id:
-        query = query.filter(Transaction.business_id == business_id)
-        
-    return [
-        TransactionRead.model_validate(t)
-        for t in query.offset(skip).limit(limit).all()
-    ]
+        stmt = stmt.where(Transaction.business_id == business_id)
+    
+    return await db.scalar(stmt)
 
 # Crea una nueva transacción en la base de datos y retorna la transacción creada
-def create_transaction(db: Session, transaction: TransactionCreate) -> TransactionRead:
+async def create_transaction(db: AsyncSession, transaction: TransactionCreate) -> TransactionRead:
     db_transaction = Transaction(**transaction.model_dump())
     db.add(db_transaction)
-    db.commit()
-    db.refresh(db_transaction)
+    await db.commit()
+    clear_request_cache()
+    await db.refresh(db_transaction)
     return TransactionRead.model_validate(db_transaction)
 
+# Crea varias transacciones en un único INSERT ... RETURNING y las retorna
+async def create_transactions_bulk(
+    db: AsyncSession,
+    transactions: List[TransactionCreate]
+) -> List[TransactionRead]:
+    if not transactions:
+        return []
+    
+    result = await db.scalars(
+        insert(Transaction).returning(Transaction, sort_by_parameter_order=True),
+        [transaction.model_dump() for transaction in transactions]
+    )
+    created = _TRANSACTION_LIST_ADAPTER.validate_python(result.all(), from_attributes=True)
+    await db.commit()
+    clear_request_cache()
+    return created
+
 # Actualiza una transacción existente
-def update_transaction(
-    db: Session,
+async def update_transaction(
+    db: AsyncSession,
     transaction_id: int,
     transaction: TransactionUpdate
 ) -> Optional[TransactionRead]:
-    db_transaction = db.query(Transaction).filter(Transaction.id == transaction_id).first()
+    db_transaction = await db.get(Transaction, transaction_id)
     if not db_transaction:
         return None
     
@@ -90,16 +145,18 @@ def update_transaction(
     for field, value in update_data.items():
         setattr(db_transaction, field, value)
     
-    db.commit()
-    db.refresh(db_transaction)
+    await db.commit()
+    clear_request_cache()
+    await db.refresh(db_transaction)
     return TransactionRead.model_validate(db_transaction)
 
 # Elimina una transacción por su ID
-def delete_transaction(db: Session, transaction_id: int) -> bool:
-    db_transaction = db.query(Transaction).filter(Transaction.id == transaction_id).first()
+async def delete_transaction(db: AsyncSession, transaction_id: int) -> bool:
+    db_transaction = await db.get(Transaction, transaction_id)
     if not db_transaction:
         return False
     
-    db.delete(db_transaction)
-    db.commit()
+    await db.delete(db_transaction)
+    await db.commit()
+    clear_request_cache()
     return True
\ No newline at end of file
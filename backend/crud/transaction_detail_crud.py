@@ -1,5 +1,6 @@
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from backend.models.transaction_detail import TransactionDetail
 from backend.schemas.transaction_detail_schema import (
     TransactionDetailCreate,
@@ -72,6 +73,26 @@ def get_transaction_details(
         for d in query.offset(skip).limit(limit).all()
     ]
 
+# Itera los detalles de transacción leyendo del cursor por lotes (yield_per)
+def iter_transaction_details(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    transaction_id: Optional[int] = None,
+    product_id: Optional[int] = None,
+    batch_size: int = 200
+) -> Iterator[TransactionDetailRead]:
+    stmt = select(TransactionDetail)
+    
+    if transaction_id:
+        stmt = stmt.where(TransactionDetail.transaction_id == transaction_id)
+    if product_id:
+        stmt = stmt.where(TransactionDetail.product_id == product_id)
+    
+    stmt = stmt.offset(skip).limit(limit).execution_options(yield_per=batch_size)
+    for detail in db.scalars(stmt):
+        yield TransactionDetailRead.model_validate(detail)
+
 # Crea un nuevo detalle de transacción en la base de datos y retorna el detalle creado
 def create_transaction_detail(db: Session, detail: TransactionDetailCreate) -> TransactionDetailRead:
     db_detail = TransactionDetail(**detail.model_dump())
@@ -80,31 +101,37 @@ def create_transaction_detail(db: Session, detail: TransactionDetailCreate) -> T
     db.refresh(db_detail)
     return TransactionDetailRead.model_validate(db_detail)
 
-# Actualiza un detalle de transacción existente
+# Actualiza un detalle de transacción existente (UPDATE ... RETURNING)
 def update_transaction_detail(
     db: Session,
     detail_id: int,
     detail: TransactionDetailUpdate
 ) -> Optional[TransactionDetailRead]:
-    db_detail = db.query(TransactionDetail).filter(TransactionDetail.id == detail_id).first()
+    update_data = detail.model_dump(exclude_unset=True)
+    if not update_data:
+        return get_transaction_detail(db, detail_id)
+    
+    db_detail = db.execute(
+        update(TransactionDetail)
+        .where(TransactionDetail.id == detail_id)
+        .values(**update_data)
+        .returning(TransactionDetail)
+    ).scalar_one_or_none()
     if not db_detail:
         return None
     
-    update_data = detail.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_detail, field, value)
-    
+    result = TransactionDetailRead.model_validate(db_detail)
     db.commit()
-    db.refresh(db_detail)
-    return TransactionDetailRead.model_validate(db_detail)
+    return result
 
-# Elimina un detalle de transacción existente por su ID
+# Elimina un detalle de transacción existente por su ID en una sola sentencia
 def delete_transaction_detail(db: Session, detail_id: int) -> bool:
-    db_detail = db.query(TransactionDetail).filter(TransactionDetail.id == detail_id).first()
-    if not db_detail:
+    result = db.execute(
+        delete(TransactionDetail).where(TransactionDetail.id == detail_id)
+    )
+    if result.rowcount == 0:
         return False
     
-    db.delete(db_detail)
     db.commit()
     return True
 
@@ -161,4 +188,15 @@ def get_all_transaction_details_with_relations(
         
         details_list.append(TransactionDetailWithRelations.model_validate(detail_data))
     
-    return details_list
\ No newline at end of file
+    return details_list
+
+# Obtiene los IDs de los productos con más unidades vendidas
+def get_top_selling_product_ids(db: Session, limit: int = 5) -> List[int]:
+    stmt = (
+        select(TransactionDetail.product_id)
+        .where(TransactionDetail.product_id.is_not(None))
+        .group_by(TransactionDetail.product_id)
+        .order_by(func.sum(TransactionDetail.cantidad).desc())
+        .limit(limit)
+    )
+    return list(db.scalars(stmt))
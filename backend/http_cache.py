@@ -0,0 +1,60 @@
+"""
+Utilidades de caché HTTP (ETag / If-None-Match) para las rutas de la API
+"""
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+# Respuestas por usuario que el navegador puede reutilizar sin revalidar durante 30 s
+PRIVATE_CACHE_CONTROL = "private, max-age=30"
+
+
+def compute_etag(body: bytes) -> str:
+    """Genera un ETag débil a partir del contenido serializado."""
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Indica si el cliente ya tiene la versión identificada por `etag`."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # La comparación débil ignora el prefijo W/ (RFC 9110, sección 13.1.2)
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in header.split(",")
+    )
+
+
+def etag_response(request: Request, model: BaseModel, cache_control: Optional[str] = None) -> Response:
+    """
+    Serializa `model` y responde 304 si el cliente envía un ETag vigente.
+
+    Args:
+        cache_control: Valor opcional para la cabecera Cache-Control
+
+    Returns:
+        Response con el cuerpo JSON y cabecera ETag, o 304 sin cuerpo
+    """
+    body = model.model_dump_json().encode()
+    return etag_bytes_response(request, compute_etag(body), body, cache_control)
+
+
+def etag_bytes_response(
+    request: Request,
+    etag: str,
+    body: bytes,
+    cache_control: Optional[str] = None
+) -> Response:
+    """Igual que etag_response, para un cuerpo JSON ya serializado con su ETag."""
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
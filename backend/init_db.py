@@ -13,6 +13,7 @@ def init_db():
     try:
         print("Inicializando base de datos...")
         Base.metadata.create_all(bind=engine)
+        create_missing_indexes()
         print("✅ Base de datos creada correctamente.")
         print("Tablas creadas:")
         for table_name in Base.metadata.tables.keys():
@@ -21,6 +22,12 @@ def init_db():
         print(f"❌ Error al crear la base de datos: {e}")
         raise
 
+def create_missing_indexes():
+    """Create indexes added to the models after their tables already existed"""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
 def drop_all_tables():
     """Drop all tables (useful for development)"""
     try:
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, DateTime, Numeric, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, Numeric, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from backend.base import Base
 
 class Transaction(Base):
     __tablename__ = "transaction"
+    __table_args__ = (
+        # Listado por negocio paginado por cursor: WHERE business_id = ? ORDER BY id DESC
+        Index("ix_transaction_business_id_id", "business_id", text("id DESC")),
+    )
 
     id = Column(Integer, primary_key=True)
     business_id = Column(Integer, ForeignKey("business.id"))
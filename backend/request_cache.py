@@ -0,0 +1,63 @@
+"""
+Caché de consultas con alcance de petición HTTP
+
+Cada petición recibe un diccionario propio (vía ContextVar) donde se memorizan
+las lecturas por clave primaria; se descarta al terminar la petición.
+"""
+from contextvars import ContextVar
+from functools import wraps
+import inspect
+from typing import Any, Dict, Optional
+
+_request_cache: ContextVar[Optional[Dict[Any, Any]]] = ContextVar("request_cache", default=None)
+
+
+class RequestCacheMiddleware:
+    """Middleware ASGI que abre una caché vacía para cada petición HTTP."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = _request_cache.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_cache.reset(token)
+
+
+def request_cached(func):
+    """
+    Memoriza el resultado de una función CRUD asíncrona durante la petición.
+
+    La sesión (primer argumento) no forma parte de la clave; fuera de una
+    petición HTTP la función se ejecuta sin caché.
+    """
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    async def wrapper(db, *args, **kwargs):
+        cache = _request_cache.get()
+        if cache is None:
+            return await func(db, *args, **kwargs)
+
+        # Normaliza argumentos posicionales y por nombre a una misma clave
+        bound = signature.bind(db, *args, **kwargs)
+        bound.apply_defaults()
+        key = (func.__qualname__, tuple(bound.arguments.values())[1:])
+        if key not in cache:
+            cache[key] = await func(db, *args, **kwargs)
+        return cache[key]
+
+    return wrapper
+
+
+def clear_request_cache() -> None:
+    """Invalida las lecturas memorizadas en la petición actual."""
+    cache = _request_cache.get()
+    if cache is not None:
+        cache.clear()
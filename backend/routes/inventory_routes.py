@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -16,11 +17,15 @@ from backend.crud.inventory_crud import (
     get_inventory_by_product
 )
 from backend.base import get_db
+from backend.http_cache import etag_response
 
 router = APIRouter(
     prefix="/inventory",
     tags=["Inventory"])
 
+# Serializador compilado una sola vez para el listado de inventario
+_INVENTORY_LIST_ADAPTER = TypeAdapter(List[InventoryRead])
+
 @router.get("/", response_model=List[InventoryRead],
             summary="Obtener todos los registros de inventario",
             description="Obtiene una lista de todos los registros de inventario con paginación y filtrado opcional" )
@@ -33,15 +38,18 @@ def read_inventory(
     ),
     db: Session = Depends(get_db)
 ):
-    
-    return get_all_inventory(db, skip=skip, limit=limit, min_stock=min_stock)
+    rows = get_all_inventory(db, skip=skip, limit=limit, min_stock=min_stock)
+    return Response(
+        content=_INVENTORY_LIST_ADAPTER.dump_json(rows),
+        media_type="application/json"
+    )
 
 
 # Ruta GET para obtener un registro de inventario por ID
 @router.get("/{inventory_id}", response_model=InventoryRead,
             summary="Obtener un registro de inventario por ID",
             description="Obtiene un registro de inventario específico por su ID")
-def read_single_inventory(inventory_id: int, db: Session = Depends(get_db)):
+def read_single_inventory(inventory_id: int, request: Request, db: Session = Depends(get_db)):
     
     inventory = get_inventory(db, inventory_id=inventory_id)
     if not inventory:
@@ -49,7 +57,7 @@ def read_single_inventory(inventory_id: int, db: Session = Depends(get_db)):
             status_code=404,
             detail="Inventory record not found"
         )
-    return inventory
+    return etag_response(request, inventory)
 
 # Ruta GET para obtener el inventario de un producto específico
 @router.get("/product/{product_id}", response_model=InventoryRead,
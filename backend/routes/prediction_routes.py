@@ -2,20 +2,96 @@
 Rutas REST para predicciones de demanda usando modelos de ML
 """
 from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi.concurrency import run_in_threadpool
+from functools import lru_cache
+import asyncio
+import logging
+import os
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
-import sys
-import os
-
-# Agregar el directorio raíz al path para importar módulos
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
 
-from models.predict import predict_demanda, ModelPredictor
-from backend.base import get_db
+from backend.base import get_db, SessionLocal
+from backend.crud.transaction_detail_crud import get_top_selling_product_ids
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
+# Número de productos más vendidos cuyo modelo se precalienta al arrancar (0 desactiva)
+PREDICTION_WARMUP_TOP_N = int(os.getenv("PREDICTION_WARMUP_TOP_N", "5"))
+PREDICTION_WARMUP_DAYS = 7
+
+# Los módulos de ML (numpy/sklearn/joblib) se cargan en la primera petición
+# de predicción (o en el precalentamiento), no al importar la app, para no
+# penalizar el arranque del worker ni las rutas que no los usan. Los cargadores
+# se invocan siempre en el threadpool: la importación no bloquea el event loop.
+@lru_cache(maxsize=None)
+def _load_predict_api():
+    from models.predict import predict_demanda, ModelPredictor
+    return predict_demanda, ModelPredictor
+
+@lru_cache(maxsize=None)
+def _load_comparison_api():
+    from models.utils.model_comparison import ModelComparatorMejorado
+    from models.utils.data_processing import obtener_datos_enriquecidos
+    return ModelComparatorMejorado, obtener_datos_enriquecidos
+
+def _warm_product(producto_id: int) -> bool:
+    """Predice con todos los modelos de un producto y deja el resultado en caché."""
+    _, ModelPredictor = _load_predict_api()
+    # dias_adelante por nombre: validate_prediction_input sólo lo lee de kwargs
+    result = ModelPredictor(producto_id).predict_all_models(
+        dias_adelante=PREDICTION_WARMUP_DAYS,
+        use_cache=True
+    )
+    return bool(result)
+
+async def warm_prediction_cache(top_n: int = PREDICTION_WARMUP_TOP_N) -> List[int]:
+    """
+    Precalienta los modelos de los productos más vendidos.
+    
+    Ejecuta una predicción por producto en el threadpool, en paralelo, para
+    que la primera petición real no pague la carga en frío de los módulos de
+    ML, los datos y los artefactos del modelo.
+    
+    Args:
+        top_n: Número de productos a precalentar
+        
+    Returns:
+        IDs de los productos cuya predicción quedó en caché
+    """
+    if top_n <= 0:
+        return []
+    
+    # Los módulos de ML se importan aquí, fuera del event loop, para que la
+    # primera petición de predicción no pague esa importación
+    await run_in_threadpool(_load_predict_api)
+    
+    db = SessionLocal()
+    try:
+        product_ids = get_top_selling_product_ids(db, limit=top_n)
+    finally:
+        db.close()
+    
+    if not product_ids:
+        return []
+    
+    results = await asyncio.gather(
+        *(run_in_threadpool(_warm_product, producto_id) for producto_id in product_ids),
+        return_exceptions=True
+    )
+    warmed = []
+    for producto_id, result in zip(product_ids, results):
+        if isinstance(result, Exception):
+            logger.warning("No se pudo precalentar el producto %s: %s", producto_id, result)
+        elif not result:
+            logger.warning("No se generaron predicciones para precalentar el producto %s", producto_id)
+        else:
+            warmed.append(producto_id)
+    
+    return warmed
+
 # Modelos Pydantic para request/response
 class PredictionRequest(BaseModel):
     producto_id: int
@@ -61,10 +137,14 @@ async def predecir_demanda(
             raise HTTPException(status_code=400, detail="Días adelante debe estar entre 1 y 365")
         
         # Crear predictor
+        _, ModelPredictor = await run_in_threadpool(_load_predict_api)
         predictor = ModelPredictor(request.producto_id)
         
         # Obtener predicciones con todos los modelos
-        result = predictor.predict_all_models(
+        # La inferencia es CPU-bound: se ejecuta en el threadpool para no
+        # bloquear el event loop mientras se atienden otras peticiones
+        result = await run_in_threadpool(
+            predictor.predict_all_models,
             dias_adelante=request.dias_adelante,
             include_confidence=request.include_confidence,
             use_cache=request.use_cache
@@ -113,7 +193,8 @@ async def predecir_demanda_simple(
     """
     try:
         # Usar función simple para compatibilidad
-        predicciones = predict_demanda(producto_id, dias_adelante)
+        predict_demanda, _ = await run_in_threadpool(_load_predict_api)
+        predicciones = await run_in_threadpool(predict_demanda, producto_id, dias_adelante)
         
         if not predicciones:
             raise HTTPException(
@@ -155,11 +236,10 @@ async def comparar_modelos(
         Resultados de comparación de modelos
     """
     try:
-        from models.utils.model_comparison import ModelComparatorMejorado
-        from models.utils.data_processing import obtener_datos_enriquecidos
+        ModelComparatorMejorado, obtener_datos_enriquecidos = await run_in_threadpool(_load_comparison_api)
         
         # Obtener datos para evaluación
-        data = obtener_datos_enriquecidos(producto_id)
+        data = await run_in_threadpool(obtener_datos_enriquecidos, producto_id)
         
         if data.empty:
             raise HTTPException(
@@ -169,7 +249,11 @@ async def comparar_modelos(
         
         # Crear comparador y ejecutar comparación
         comparator = ModelComparatorMejorado(producto_id)
-        results = comparator.compare_all_models(data, retrain_if_needed=forzar_reentrenamiento)
+        results = await run_in_threadpool(
+            comparator.compare_all_models,
+            data,
+            retrain_if_needed=forzar_reentrenamiento
+        )
         
         response = ModelComparisonResponse(
             producto_id=producto_id,
@@ -200,6 +284,7 @@ async def obtener_stats_cache(
         Estadísticas del caché
     """
     try:
+        _, ModelPredictor = await run_in_threadpool(_load_predict_api)
         predictor = ModelPredictor(producto_id)
         stats = predictor.get_cache_stats()
         
@@ -227,6 +312,7 @@ async def limpiar_cache(
         Confirmación de limpieza
     """
     try:
+        _, ModelPredictor = await run_in_threadpool(_load_predict_api)
         predictor = ModelPredictor(producto_id)
         predictor.clear_cache()
         
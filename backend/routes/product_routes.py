@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from backend.schemas.product_schema import (
     ProductCreate,
@@ -17,6 +17,7 @@ from backend.crud.product_crud import (
     get_product_with_relations
 )
 from backend.base import get_db
+from backend.http_cache import etag_response
 
 
 router = APIRouter(
@@ -28,20 +29,25 @@ router = APIRouter(
 @router.get("/", response_model=List[ProductRead],
             summary="Obtener todos los productos",
             description="Obtiene una lista de todos los productos disponibles en la tabla products")
-def read_products(skip: int = 0, limit: int = 150, db: Session = Depends(get_db)):
+def read_products(
+    skip: int = 0,
+    limit: int = 150,
+    business_id: Optional[int] = Query(None, description="Filtrar por ID de negocio"),
+    db: Session = Depends(get_db)
+):
     
-    return get_products(db, skip=skip, limit=limit)
+    return get_products(db, skip=skip, limit=limit, business_id=business_id)
 
 #Ruta GET para obtener un negocio por su ID
 @router.get("/{product_id}", response_model=ProductRead,
             summary="Obtener un producto por su ID",
             description="Obtiene los datos de un producto específico por su ID")
-def read_product(product_id: int, db: Session = Depends(get_db)):
+def read_product(product_id: int, request: Request, db: Session = Depends(get_db)):
     
     product = get_product(db, product_id=product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    return product
+    return etag_response(request, product)
 
 #Ruta GET para obtener detalles completos de un producto con relaciones
 @router.get("/{product_id}/details", response_model=ProductWithRelations,
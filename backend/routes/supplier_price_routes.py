@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -18,6 +18,7 @@ from backend.crud.supplier_price_crud import (
     get_all_supplier_prices_with_relations
 )
 from backend.base import get_db
+from backend.http_cache import etag_response
 
 router = APIRouter(
     prefix="/supplier-prices",
@@ -47,11 +48,11 @@ def read_prices(
 @router.get("/{price_id}", response_model=SupplierPriceRead,
            summary="Obtener precio por ID",
            description="Obtiene los detalles básicos de un precio de proveedor")
-def read_price(price_id: int, db: Session = Depends(get_db)):
+def read_price(price_id: int, request: Request, db: Session = Depends(get_db)):
     price = get_supplier_price(db, price_id=price_id)
     if not price:
         raise HTTPException(status_code=404, detail="Supplier price not found")
-    return price
+    return etag_response(request, price)
 
 # Ruta GET para obtener detalles completos de un precio con relaciones
 @router.get("/{price_id}/details", response_model=SupplierPriceWithRelations,
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
@@ -15,6 +15,7 @@ from backend.crud.supplier_crud import (
     delete_supplier
 )
 from backend.base import get_db
+from backend.http_cache import etag_response
 
 router = APIRouter(
     prefix="/suppliers",
@@ -37,7 +38,7 @@ def read_suppliers(
 @router.get("/{supplier_id}", response_model=SupplierRead,
             summary="Obtener un proveedor por su ID",
             description="Obtiene los datos de un proveedor específico por su ID")
-def read_supplier(supplier_id: int, db: Session = Depends(get_db)):
+def read_supplier(supplier_id: int, request: Request, db: Session = Depends(get_db)):
     
     supplier = get_supplier(db, supplier_id=supplier_id)
     if not supplier:
@@ -45,7 +46,7 @@ def read_supplier(supplier_id: int, db: Session = Depends(get_db)):
             status_code=404,
             detail="Supplier not found"
         )
-    return supplier
+    return etag_response(request, supplier)
 
 #Ruta POST para crear un nuevo proveedor
 @router.post("/new", response_model=SupplierRead,
@@ -1,5 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
 from typing import List, Optional
 
 from backend.schemas.transaction_detail_schema import (
@@ -11,19 +15,24 @@ from backend.schemas.transaction_detail_schema import (
 from backend.crud.transaction_detail_crud import (
     get_transaction_detail,
     get_transaction_detail_with_relations,
-    get_transaction_details,
+    iter_transaction_details,
     create_transaction_detail,
     update_transaction_detail,
     delete_transaction_detail,
     get_all_transaction_details_with_relations
 )
-from backend.base import get_db
+from backend.base import get_db, SessionLocal
+from backend.http_cache import etag_response
+from backend.streaming import json_array_stream
 
 router = APIRouter(
     prefix="/transaction-details",
     tags=["Transaction Details"]
 )
 
+# Serializador compilado una sola vez para el listado con relaciones
+_DETAIL_FULL_LIST_ADAPTER = TypeAdapter(List[TransactionDetailWithRelations])
+
 #obtiene todos los detalles de transacción
 @router.get("/", response_model=List[TransactionDetailRead],
            summary="Listar detalles de transacción",
@@ -32,26 +41,44 @@ def read_transaction_details(
     skip: int = 0,
     limit: int = 1000,
     transaction_id: Optional[int] = Query(None, description="Filtrar por ID de transacción"),
-    product_id: Optional[int] = Query(None, description="Filtrar por ID de producto"),
-    db: Session = Depends(get_db)
+    product_id: Optional[int] = Query(None, description="Filtrar por ID de producto")
 ):
-    return get_transaction_details(
-        db,
-        skip=skip,
-        limit=limit,
-        transaction_id=transaction_id,
-        product_id=product_id
-    )
+    # Como en transaction_routes, el cuerpo se lee con una sesión propia abierta
+    # dentro del generador y no con la de SessionRegistry: el cursor (yield_per)
+    # sigue abierto mientras se envía la respuesta y no debe compartir conexión
+    # con las demás dependencias de la petición
+    def stream_rows():
+        with SessionLocal() as db:
+            yield from json_array_stream(iter_transaction_details(
+                db,
+                skip=skip,
+                limit=limit,
+                transaction_id=transaction_id,
+                product_id=product_id
+            ))
+    
+    # iterate_in_threadpool no cierra el generador si el cliente se desconecta;
+    # se cierra aquí para que la sesión se libere también al cancelar
+    async def stream_body():
+        rows = stream_rows()
+        try:
+            async for chunk in iterate_in_threadpool(rows):
+                yield chunk
+        finally:
+            with anyio.CancelScope(shield=True):
+                await run_in_threadpool(rows.close)
+    
+    return StreamingResponse(stream_body(), media_type="application/json")
 
 # Ruta GET para obtener un detalle de transacción por su ID
 @router.get("/{detail_id}", response_model=TransactionDetailRead,
            summary="Obtener detalle por ID",
            description="Obtiene los detalles básicos de un item de transacción")
-def read_transaction_detail(detail_id: int, db: Session = Depends(get_db)):
+def read_transaction_detail(detail_id: int, request: Request, db: Session = Depends(get_db)):
     detail = get_transaction_detail(db, detail_id=detail_id)
     if not detail:
         raise HTTPException(status_code=404, detail="Transaction detail not found")
-    return detail
+    return etag_response(request, detail)
 
 # Ruta GET para obtener detalles completos de un detalle de transacción con relaciones
 @router.get("/{detail_id}/details", response_model=TransactionDetailWithRelations,
@@ -122,10 +149,14 @@ def get_full_transaction_details(
     db: Session = Depends(get_db)
 ):
 
-    return get_all_transaction_details_with_relations(
+    rows = get_all_transaction_details_with_relations(
         db=db,
         skip=skip,
         limit=limit,
         transaction_id=transaction_id,
         product_id=product_id
+    )
+    return Response(
+        content=_DETAIL_FULL_LIST_ADAPTER.dump_json(rows),
+        media_type="application/json"
     )
\ No newline at end of file
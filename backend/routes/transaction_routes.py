@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 
 from backend.schemas.transaction_schema import (
     TransactionCreate,
+    TransactionPage,
     TransactionRead,
     TransactionUpdate,
     TransactionWithRelations
@@ -11,77 +15,182 @@ from backend.schemas.transaction_schema import (
 from backend.crud.transaction_crud import (
     get_transaction,
     get_transaction_with_relations,
-    get_transactions,
+    iter_transactions,
+    count_transactions,
     create_transaction,
+    create_transactions_bulk,
     update_transaction,
     delete_transaction
 )
-from backend.base import get_db
+from backend.base import AsyncSessionLocal, get_async_db
+from backend.http_cache import (
+    PRIVATE_CACHE_CONTROL,
+    compute_etag,
+    etag_bytes_response,
+    etag_response
+)
+from backend.models.transaction import Transaction
+from backend import shared_cache
 
 router = APIRouter(
     prefix="/transactions",
-    tags=["Transactions"]
+    tags=["Transactions"],
+    default_response_class=ORJSONResponse
 )
 
+# Serializador compilado una sola vez para las respuestas con lista de transacciones
+_TRANSACTION_LIST_ADAPTER = TypeAdapter(List[TransactionRead])
+
+# Los modelos que devuelve el CRUD ya están validados: se serializan directamente
+# en lugar de dejar que response_model los vuelque a dict y los valide de nuevo.
+# response_model se mantiene en los decoradores para la documentación OpenAPI
+def _model_response(model: BaseModel, status_code: int = 200) -> Response:
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+# Cuerpos JSON ya serializados de GET /transactions/{id}: transaction_id -> (etag, body)
+# Es por proceso: se invalida al actualizar o eliminar la transacción en este
+# worker, y el TTL acota cuánto puede servir otro worker una versión anterior.
+# Con Redis activo no se usa, porque su invalidación no llega a los demás workers
+_transaction_cache: TTLCache = TTLCache(maxsize=4096, ttl=shared_cache.SHARED_CACHE_TTL)
+
+# Caché L2 compartida entre workers (Redis, opcional); se invalida con eventos del ORM
+def _transaction_cache_key(transaction_id: int) -> str:
+    return f"tx:{transaction_id}"
+
+shared_cache.invalidate_on_change(Transaction, lambda t: _transaction_cache_key(t.id))
+
+# Invalida ambos niveles antes de responder: el borrado en Redis que disparan los
+# eventos del ORM es asíncrono y una lectura inmediata podría recuperar el valor anterior
+async def _invalidate_transaction(transaction_id: int) -> None:
+    _transaction_cache.pop(transaction_id, None)
+    await shared_cache.cache_delete(_transaction_cache_key(transaction_id))
+
 #Obtener todas las transacciones
-@router.get("/", response_model=List[TransactionRead],
+@router.get("/", response_model=TransactionPage,
            summary="Listar transacciones",
-           description="Obtiene una lista paginada de transacciones")
-def read_transactions(
-    skip: int = 0,
-    limit: int = 100,
+           description="Obtiene una lista paginada por cursor de transacciones, de la más reciente a la más antigua")
+async def read_transactions(
+    cursor: Optional[int] = Query(None, description="ID de la última transacción de la página anterior"),
+    limit: int = Query(100, ge=1, le=1000),
     business_id: Optional[int] = Query(None, description="Filtrar por ID de negocio"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    return get_transactions(db, skip=skip, limit=limit, business_id=business_id)
+    total = await count_transactions(db, business_id=business_id)
+    
+    # Emite el sobre de TransactionPage fila a fila; la sesión se abre dentro del
+    # generador porque la de la dependencia se cierra antes de enviar el cuerpo
+    async def stream_page():
+        last_id, count = None, 0
+        yield b'{"items":['
+        async with AsyncSessionLocal() as stream_db:
+            async for item in iter_transactions(
+                stream_db,
+                cursor=cursor,
+                limit=limit,
+                business_id=business_id
+            ):
+                if count:
+                    yield b","
+                yield item.model_dump_json().encode()
+                last_id, count = item.id, count + 1
+        next_cursor = last_id if count == limit else None
+        yield b'],"total":%d,"size":%d,"next_cursor":%s}' % (
+            total, limit, b"null" if next_cursor is None else b"%d" % next_cursor
+        )
+    
+    return StreamingResponse(
+        stream_page(),
+        media_type="application/json",
+        headers={"Cache-Control": PRIVATE_CACHE_CONTROL}
+    )
 
 #Ruta GET para obtener una transacción por su ID
 @router.get("/{transaction_id}", response_model=TransactionRead,
            summary="Obtener transacción por ID",
            description="Obtiene los detalles básicos de una transacción")
-def read_transaction(transaction_id: int, db: Session = Depends(get_db)):
-    transaction = get_transaction(db, transaction_id=transaction_id)
-    if not transaction:
-        raise HTTPException(status_code=404, detail="Transaction not found")
-    return transaction
+async def read_transaction(
+    transaction_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    use_local_cache = not shared_cache.is_enabled()
+    cached = _transaction_cache.get(transaction_id) if use_local_cache else None
+    if cached is None:
+        key = _transaction_cache_key(transaction_id)
+        body = await shared_cache.cache_get(key)
+        if body is None:
+            transaction = await get_transaction(db, transaction_id=transaction_id)
+            if not transaction:
+                raise HTTPException(status_code=404, detail="Transaction not found")
+            body = transaction.model_dump_json().encode()
+            await shared_cache.cache_set(key, body)
+        cached = (compute_etag(body), body)
+        if use_local_cache:
+            _transaction_cache[transaction_id] = cached
+    return etag_bytes_response(request, *cached, cache_control=PRIVATE_CACHE_CONTROL)
 
 #Ruta GET para obtener detalles completos de una transacción con relaciones
 @router.get("/{transaction_id}/details", response_model=TransactionWithRelations,
            summary="Obtener detalles completos de transacción",
            description="Obtiene los detalles completos de una transacción incluyendo negocio y items")
-def read_transaction_details(transaction_id: int, db: Session = Depends(get_db)):
-    transaction = get_transaction_with_relations(db, transaction_id=transaction_id)
+async def read_transaction_details(
+    transaction_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+):
+    transaction = await get_transaction_with_relations(db, transaction_id=transaction_id)
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
-    return transaction
+    return etag_response(request, transaction, cache_control=PRIVATE_CACHE_CONTROL)
 
 #Ruta POST para crear una nueva transacción
 @router.post("/new", response_model=TransactionRead, status_code=201,
             summary="Crear nueva transacción",
             description="Registra una nueva transacción en el sistema")
-def create_new_transaction(
+async def create_new_transaction(
     transaction: TransactionCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
+):
+    created = await create_transaction(db=db, transaction=transaction)
+    return _model_response(created, status_code=201)
+
+#Ruta POST para crear varias transacciones en una sola operación
+@router.post("/bulk", response_model=List[TransactionRead], status_code=201,
+            summary="Crear transacciones en lote",
+            description="Registra varias transacciones con un único INSERT en la base de datos")
+async def create_new_transactions_bulk(
+    transactions: List[TransactionCreate],
+    db: AsyncSession = Depends(get_async_db)
 ):
-    return create_transaction(db=db, transaction=transaction)
+    created = await create_transactions_bulk(db=db, transactions=transactions)
+    return Response(
+        content=_TRANSACTION_LIST_ADAPTER.dump_json(created),
+        status_code=201,
+        media_type="application/json"
+    )
 
 #Ruta PUT para actualizar una transacción existente
 @router.put("/update/{transaction_id}", response_model=TransactionRead,
            summary="Actualizar transacción",
            description="Actualiza los datos de una transacción existente")
-def update_existing_transaction(
+async def update_existing_transaction(
     transaction_id: int,
     transaction: TransactionUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    updated_transaction = update_transaction(
+    updated_transaction = await update_transaction(
         db, 
         transaction_id=transaction_id, 
         transaction=transaction
     )
+    await _invalidate_transaction(transaction_id)
     if not updated_transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
-    return updated_transaction
+    return _model_response(updated_transaction)
 
 #ruta DELETE para eliminar una transacción existente
 @router.delete("/delete/{transaction_id}",
@@ -91,8 +200,9 @@ def update_existing_transaction(
                   200: {"description": "Transacción eliminada exitosamente"},
                   404: {"description": "Transacción no encontrada"}
               })
-def delete_existing_transaction(transaction_id: int, db: Session = Depends(get_db)):
-    success = delete_transaction(db, transaction_id=transaction_id)
+async def delete_existing_transaction(transaction_id: int, db: AsyncSession = Depends(get_async_db)):
+    success = await delete_transaction(db, transaction_id=transaction_id)
+    await _invalidate_transaction(transaction_id)
     if not success:
         raise HTTPException(status_code=404, detail="Transaction not found")
     return {"status": "success", "message": "Transaction deleted"}
\ No newline at end of file
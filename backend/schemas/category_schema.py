@@ -1,5 +1,5 @@
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
 
 # Base común para creación y lectura
@@ -25,9 +25,4 @@ class CategoryRead(CategoryBase):
     id: int
     fecha_registro: Optional[datetime] = None
 
-    class Config:
-        
-        from_attributes = True  # Permite carga desde objetos SQLAlchemy
-        json_encoders = {
-            datetime: lambda v: v.isoformat()  # Formatea fechas en JSON
-        }
+    model_config = ConfigDict(from_attributes=True)  # Permite carga desde objetos SQLAlchemy
@@ -30,7 +30,4 @@ class InventoryRead(InventoryBase):
     ultimo_ingreso: datetime
     producto: Optional[ProductRead] = None  # Relación con producto
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        json_encoders={datetime: lambda v: v.isoformat()}
-    )
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
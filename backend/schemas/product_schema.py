@@ -31,12 +31,7 @@ class ProductRead(ProductBase):
     id: int
     fecha_registro: Optional[datetime] = None
 
-    class Config:
-        
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()  
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 # Para leer un producto con relaciones (GET con relaciones)
 class ProductWithRelations(ProductRead):
@@ -44,7 +39,4 @@ class ProductWithRelations(ProductRead):
     categoria: Optional[dict] = None  
     business: Optional[dict] = None   
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        json_encoders={datetime: lambda v: v.isoformat()}
-    )
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
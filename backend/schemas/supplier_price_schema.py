@@ -31,8 +31,7 @@ class SupplierPriceRead(SupplierPriceBase):
     fecha: Optional[datetime] = None
     
     model_config = ConfigDict(
-        from_attributes=True,
-        json_encoders={datetime: lambda v: v.isoformat()}
+        from_attributes=True
     )
 
 # para leer un precio de proveedor con relaciones (GET con detalles)
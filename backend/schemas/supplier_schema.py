@@ -31,8 +31,4 @@ class SupplierRead(SupplierBase):
     id: int
     fecha_registro: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
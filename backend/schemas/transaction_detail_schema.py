@@ -1,6 +1,5 @@
 from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
-from datetime import datetime
 
 #Base común para creación y lectura
 class TransactionDetailBase(BaseModel):
@@ -32,12 +31,7 @@ class TransactionDetailUpdate(BaseModel):
 class TransactionDetailRead(TransactionDetailBase):
     id: int
     
-    model_config = ConfigDict(
-        from_attributes=True,
-        json_encoders={
-            datetime: lambda v: v.isoformat() if v else None
-        }
-    )
+    model_config = ConfigDict(from_attributes=True)
 
 #Para leer un detalle de transacción con relaciones (GET con relaciones)
 class TransactionDetailWithRelations(TransactionDetailRead):
@@ -30,9 +30,16 @@ class TransactionRead(TransactionBase):
     id: int
     fecha: datetime
     
-    model_config = ConfigDict(
-        from_attributes=True,
-        json_encoders={datetime: lambda v: v.isoformat()}
+    model_config = ConfigDict(from_attributes=True)
+
+# Página de transacciones con paginación por cursor (keyset)
+class TransactionPage(BaseModel):
+    items: List[TransactionRead]
+    total: int = Field(..., description="Total de transacciones que cumplen el filtro")
+    size: int = Field(..., description="Tamaño de página solicitado")
+    next_cursor: Optional[int] = Field(
+        None,
+        description="Cursor para la siguiente página (null si no hay más resultados)"
     )
 
 # Para leer un negocio con relaciones (GET con detalles)
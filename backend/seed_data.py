@@ -1,8 +1,11 @@
+import base64
 import sys
 import os
+from collections import defaultdict
 from datetime import datetime, timedelta
 from decimal import Decimal
 import random
+import numpy as np
 from faker import Faker
 from pathlib import Path
 
@@ -10,7 +13,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, insert, inspect
 from sqlalchemy.orm import sessionmaker
 from backend.base import Base, get_db
 from backend.models import (
@@ -19,39 +22,89 @@ from backend.models import (
     Prediction, ChatLog
 )
 
-# Initialize Faker
-fake = Faker('es_ES')  # Spanish locale for more realistic data
+# Initialize Faker with only the providers the seeders use (names, text/words)
+# instead of importing every es_ES provider module
+fake = Faker('es_ES', providers=[  # Spanish locale for more realistic data
+    'faker.providers.person',
+    'faker.providers.lorem',
+])
 Faker.seed(42)  # For reproducible data
 random.seed(42)
+# Vectorized generator for the numeric columns (prices, price factors)
+rng = np.random.default_rng(42)
 
 # Database setup
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./database.db")
+# Multi-row INSERT ... VALUES batches of up to 1000 rows for the bulk inserts;
+# psycopg2 also batches the executemany() calls that have no RETURNING
+engine_options = {"insertmanyvalues_page_size": 1000}
+if DATABASE_URL.startswith("postgresql"):
+    engine_options["executemany_mode"] = "values_plus_batch"
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {},
+    **engine_options
 )
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+# Bulk-load tuning for SQLite: WAL journal, no fsync per commit, temp tables in
+# memory and a ~200 MB page cache. Only applies to this seeding engine's connections
+# (journal_mode=WAL is persistent for the database file)
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-200000")
+        cursor.close()
+
+# expire_on_commit=False: the seeded objects are read again after commit (ids,
+# precio_base...), which would otherwise issue one SELECT per expired object
+SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
+
+def to_decimals(values):
+    """Convert an array of amounts to Decimals with two decimal places"""
+    # Via integer cents: rounding happens in NumPy and each Decimal is built from
+    # an int and rescaled, with no float -> str -> Decimal parse per value
+    cents = np.rint(np.asarray(values) * 100).astype(np.int64).tolist()
+    return [Decimal(cent).scaleb(-2) for cent in cents]
+
+def random_datetimes(start, n):
+    """Draw n datetimes uniformly between start and now (whole seconds)"""
+    # start is a datetime or one datetime per row. The offsets are drawn in a
+    # single call and converted to Python datetimes in one .tolist()
+    now = np.datetime64(datetime.now(), "s")
+    start = np.asarray(start, dtype="datetime64[s]")
+    span = (now - start).astype(np.int64)
+    offsets = rng.integers(0, span + 1, n)
+    return (start + offsets.astype("timedelta64[s]")).tolist()
+
+def insert_rows(session, model, rows):
+    """Insert plain row dicts with a Core executemany (no ORM objects or bookkeeping)"""
+    if rows:
+        session.execute(model.__table__.insert(), rows)
 
 def create_tables():
     """Create all tables"""
-    Base.metadata.create_all(bind=engine)
+    # One query lists the existing tables; create_all (which probes every table
+    # separately) only runs when some of them are missing
+    existing = set(inspect(engine).get_table_names())
+    if existing.issuperset(Base.metadata.tables):
+        print("✅ Tablas ya existentes")
+        return
+    Base.metadata.create_all(bind=engine, checkfirst=True)
     print("✅ Tablas creadas exitosamente")
 
 def clear_data(session):
     """Clear all existing data"""
-    # Delete in reverse order of dependencies
-    session.query(ChatLog).delete()
-    session.query(Prediction).delete()
-    session.query(SupplierPrice).delete()
-    session.query(TransactionDetail).delete()
-    session.query(Transaction).delete()
-    session.query(Inventory).delete()
-    session.query(Product).delete()
-    session.query(Category).delete()
-    session.query(Supplier).delete()
-    session.query(User).delete()
-    session.query(Business).delete()
-    session.commit()
+    # Delete in reverse order of dependencies. Plain Core DELETEs skip the ORM
+    # bulk-delete machinery, and there is no commit here: clearing and re-seeding
+    # happen in one transaction, so a failed seed leaves the old data in place
+    for model in (
+        ChatLog, Prediction, SupplierPrice, TransactionDetail, Transaction,
+        Inventory, Product, Category, Supplier, User, Business
+    ):
+        session.execute(model.__table__.delete())
     print("🗑️ Datos existentes eliminados")
 
 def seed_businesses(session):
@@ -79,41 +132,56 @@ def seed_businesses(session):
         }
     ]
     
-    businesses = []
-    for data in businesses_data:
-        business = Business(
+    fechas = random_datetimes(datetime.now() - timedelta(days=730), len(businesses_data))
+    businesses = [
+        Business(
             nombre=data["nombre"],
             descripcion=data["descripcion"],
-            fecha_registro=fake.date_time_between(start_date='-2y', end_date='now')
+            fecha_registro=fecha
         )
-        businesses.append(business)
-        session.add(business)
-    
-    session.commit()
+        for data, fecha in zip(businesses_data, fechas)
+    ]
+    session.add_all(businesses)  # flushed by main() together with categories and suppliers
     print(f"🏢 {len(businesses)} negocios creados")
     return businesses
 
 def seed_users(session, businesses):
-    """Create sample users"""
+    """Create sample users (returned as row dicts with their generated "id")"""
     roles = ['admin', 'manager', 'employee', 'analyst']
-    users = []
     
-    for business in businesses:
-        # Create 3-5 users per business
-        num_users = random.randint(3, 5)
+    # Create 3-5 users per business
+    users_per_business = [random.randint(3, 5) for _ in businesses]
+    total_users = sum(users_per_business)
+    
+    # Generated up front in bulk. Emails use a counter instead of fake.unique
+    # (which keeps a set of every value seen) and passwords come from the seeded
+    # random module instead of fake.password
+    names = [fake.name() for _ in range(total_users)]
+    emails = [f"user{i}@example.com" for i in range(1, total_users + 1)]
+    passwords = [
+        base64.urlsafe_b64encode(random.randbytes(9)).decode()
+        for _ in range(total_users)
+    ]
+    user_roles = random.choices(roles, k=total_users)
+    # Each user is created after its business was registered
+    registros = [business.fecha_registro for business in businesses]
+    fechas = random_datetimes(np.repeat(registros, users_per_business), total_users)
+    
+    users = []
+    for business, num_users in zip(businesses, users_per_business):
         for _ in range(num_users):
-            user = User(
-                business_id=business.id,
-                nombre=fake.name(),
-                correo=fake.unique.email(),
-                contrasena=fake.password(length=12),
-                rol=random.choice(roles),
-                fecha_creacion=fake.date_time_between(start_date=business.fecha_registro, end_date='now')
-            )
-            users.append(user)
-            session.add(user)
+            i = len(users)
+            users.append({
+                "business_id": business.id,
+                "nombre": names[i],
+                "correo": emails[i],
+                "contrasena": passwords[i],
+                "rol": user_roles[i],
+                "fecha_creacion": fechas[i]
+            })
     
-    session.commit()
+    # return_defaults fills in each dict's "id", needed by the chat logs
+    session.bulk_insert_mappings(User, users, return_defaults=True)
     print(f"👥 {len(users)} usuarios creados")
     return users
 
@@ -132,16 +200,11 @@ def seed_categories(session):
         {"nombre": "Jardinería", "descripcion": "Herramientas y productos para jardín"}
     ]
     
-    categories = []
-    for data in categories_data:
-        category = Category(
-            nombre=data["nombre"],
-            descripcion=data["descripcion"]
-        )
-        categories.append(category)
-        session.add(category)
-    
-    session.commit()
+    categories = [
+        Category(nombre=data["nombre"], descripcion=data["descripcion"])
+        for data in categories_data
+    ]
+    session.add_all(categories)  # flushed by main() together with businesses and suppliers
     print(f"📂 {len(categories)} categorías creadas")
     return categories
 
@@ -158,16 +221,11 @@ def seed_suppliers(session):
         {"nombre": "Auto Parts Spain", "contacto": "auto@parts.es | +34 919 012 345"}
     ]
     
-    suppliers = []
-    for data in suppliers_data:
-        supplier = Supplier(
-            nombre=data["nombre"],
-            contacto=data["contacto"]
-        )
-        suppliers.append(supplier)
-        session.add(supplier)
-    
-    session.commit()
+    suppliers = [
+        Supplier(nombre=data["nombre"], contacto=data["contacto"])
+        for data in suppliers_data
+    ]
+    session.add_all(suppliers)  # flushed by main() together with businesses and categories
     print(f"🚚 {len(suppliers)} proveedores creados")
     return suppliers
 
@@ -201,154 +259,190 @@ def seed_products(session, businesses, categories):
         ]
     }
     
+    # Each business gets 15-25 products
+    products_per_business = [random.randint(15, 25) for _ in businesses]
+    total_products = sum(products_per_business)
+    descriptions = [fake.text(max_nb_chars=200) for _ in range(total_products)]
+    base_prices = to_decimals(rng.uniform(10.0, 500.0, total_products).round(2))
+    
+    # Categories, template picks and "add a variation" flags sampled in batch
+    category_idxs = rng.integers(0, len(categories), total_products).tolist()
+    template_picks = rng.random(total_products).tolist()
+    add_variation = (rng.random(total_products) > 0.7).tolist()
+    
     products = []
-    for business in businesses:
-        # Each business gets 15-25 products
-        num_products = random.randint(15, 25)
-        
+    for business, num_products in zip(businesses, products_per_business):
         for _ in range(num_products):
-            category = random.choice(categories)
+            i = len(products)
+            category = categories[category_idxs[i]]
             category_products = products_templates.get(category.nombre, ["Producto Genérico"])
             
-            product_name = random.choice(category_products)
+            product_name = category_products[int(template_picks[i] * len(category_products))]
             # Add variation to avoid duplicates
-            if random.random() > 0.7:
+            if add_variation[i]:
                 product_name += f" {fake.word().title()}"
             
             product = Product(
                 business_id=business.id,
                 category_id=category.id,
                 nombre=product_name,
-                descripcion=fake.text(max_nb_chars=200),
-                precio_base=Decimal(str(round(random.uniform(10.0, 500.0), 2)))
+                descripcion=descriptions[i],
+                precio_base=base_prices[i]
             )
             products.append(product)
-            session.add(product)
     
-    session.commit()
+    session.add_all(products)
+    session.flush()  # IDs needed by inventory, prices, transactions and predictions
     print(f"📦 {len(products)} productos creados")
     return products
 
 def seed_inventory(session, products):
     """Create inventory for all products"""
-    inventories = []
-    for product in products:
-        inventory = Inventory(
-            product_id=product.id,
-            stock_actual=random.randint(0, 100),
-            ultimo_ingreso=fake.date_time_between(start_date='-30d', end_date='now')
-        )
-        inventories.append(inventory)
-        session.add(inventory)
-    
-    session.commit()
+    fechas = random_datetimes(datetime.now() - timedelta(days=30), len(products))
+    inventories = [
+        {
+            "product_id": product.id,
+            "stock_actual": random.randint(0, 100),
+            "ultimo_ingreso": fecha
+        }
+        for product, fecha in zip(products, fechas)
+    ]
+    insert_rows(session, Inventory, inventories)
     print(f"📊 {len(inventories)} registros de inventario creados")
     return inventories
 
 def seed_supplier_prices(session, products, suppliers):
     """Create supplier prices for products"""
-    supplier_prices = []
+    pairs = []
     
-    for product in products:
-        # Each product has 1-3 supplier prices
-        num_suppliers = random.randint(1, min(3, len(suppliers)))
-        selected_suppliers = random.sample(suppliers, num_suppliers)
-        
-        for supplier in selected_suppliers:
-            # Supplier price is usually 60-80% of base price
-            supplier_price = float(product.precio_base) * random.uniform(0.6, 0.8)
-            
-            price_record = SupplierPrice(
-                product_id=product.id,
-                supplier_id=supplier.id,
-                precio=Decimal(str(round(supplier_price, 2))),
-                fecha=fake.date_time_between(start_date='-60d', end_date='now')
-            )
-            supplier_prices.append(price_record)
-            session.add(price_record)
+    # Each product has 1-3 supplier prices
+    suppliers_per_product = rng.integers(1, min(3, len(suppliers)) + 1, len(products)).tolist()
+    for product_idx, num_suppliers in enumerate(suppliers_per_product):
+        for supplier in random.sample(suppliers, num_suppliers):
+            pairs.append((product_idx, supplier))
     
-    session.commit()
+    # Supplier price is usually 60-80% of base price
+    base_prices = np.array([float(product.precio_base) for product in products])
+    product_idxs = np.fromiter((product_idx for product_idx, _ in pairs), dtype=np.intp, count=len(pairs))
+    prices = to_decimals((np.take(base_prices, product_idxs) * rng.uniform(0.6, 0.8, len(pairs))).round(2))
+    fechas = random_datetimes(datetime.now() - timedelta(days=60), len(pairs))
+    
+    supplier_prices = [
+        {
+            "product_id": products[product_idx].id,
+            "supplier_id": supplier.id,
+            "precio": precio,
+            "fecha": fecha
+        }
+        for (product_idx, supplier), precio, fecha in zip(pairs, prices, fechas)
+    ]
+    
+    insert_rows(session, SupplierPrice, supplier_prices)
     print(f"💰 {len(supplier_prices)} precios de proveedores creados")
     return supplier_prices
 
 def seed_transactions(session, businesses, products):
-    """Create transactions and transaction details"""
+    """Create transactions and transaction details (returned as row dicts)"""
     transactions = []
-    transaction_details = []
+    # Per detail: position of its transaction, position of its product, quantity
+    detail_tx_idxs, detail_product_idxs, cantidades = [], [], []
+    
+    # Product positions per business, built in one pass over the products
+    products_by_business = defaultdict(list)
+    for product_idx, product in enumerate(products):
+        products_by_business[product.business_id].append(product_idx)
     
     for business in businesses:
-        business_products = [p for p in products if p.business_id == business.id]
+        business_products = products_by_business[business.id]
         if not business_products:
             continue
             
-        # Create 20-40 transactions per business
-        num_transactions = random.randint(20, 40)
+        # Create 20-40 transactions per business, each with 1-5 details; the
+        # product and quantity of every detail are sampled in one call each
+        num_transactions = int(rng.integers(20, 41))
+        details_per_transaction = rng.integers(1, 6, num_transactions)
+        num_details = int(details_per_transaction.sum())
         
-        for _ in range(num_transactions):
-            transaction_date = fake.date_time_between(start_date='-90d', end_date='now')
-            
-            transaction = Transaction(
-                business_id=business.id,
-                fecha=transaction_date,
-                total=Decimal('0.00')  # Will be calculated from details
-            )
-            session.add(transaction)
-            session.flush()  # Get the ID
-            
-            # Create 1-5 transaction details per transaction
-            num_details = random.randint(1, 5)
-            transaction_total = Decimal('0.00')
-            
-            for _ in range(num_details):
-                product = random.choice(business_products)
-                cantidad = random.randint(1, 10)
-                # Price variation ±10% from base price
-                precio_unitario = float(product.precio_base) * random.uniform(0.9, 1.1)
-                precio_unitario = Decimal(str(round(precio_unitario, 2)))
-                
-                detail = TransactionDetail(
-                    transaction_id=transaction.id,
-                    product_id=product.id,
-                    cantidad=cantidad,
-                    precio_unitario=precio_unitario
-                )
-                transaction_details.append(detail)
-                session.add(detail)
-                
-                transaction_total += precio_unitario * cantidad
-            
-            transaction.total = transaction_total
-            transactions.append(transaction)
+        first_tx_idx = len(transactions)
+        detail_tx_idxs.extend(np.repeat(
+            np.arange(first_tx_idx, first_tx_idx + num_transactions),
+            details_per_transaction
+        ).tolist())
+        detail_product_idxs.extend(
+            np.take(business_products, rng.integers(0, len(business_products), num_details)).tolist()
+        )
+        cantidades.extend(rng.integers(1, 11, num_details).tolist())
+        
+        for fecha in random_datetimes(datetime.now() - timedelta(days=90), num_transactions):
+            transactions.append({
+                "business_id": business.id,
+                "fecha": fecha
+            })
     
-    session.commit()
+    # Price variation ±10% from base price, computed for every detail at once
+    base_prices = np.array([float(product.precio_base) for product in products])
+    unit_prices = (
+        np.take(base_prices, detail_product_idxs) * rng.uniform(0.9, 1.1, len(detail_product_idxs))
+    ).round(2)
+    # The totals are known before inserting, so no UPDATE is needed afterwards
+    totals = np.bincount(
+        detail_tx_idxs,
+        weights=unit_prices * np.asarray(cantidades),
+        minlength=len(transactions)
+    ).round(2)
+    for transaction, total in zip(transactions, to_decimals(totals)):
+        transaction["total"] = total
+    
+    # Single batched INSERT ... RETURNING id, in the same order as the rows
+    transaction_ids = session.scalars(
+        insert(Transaction).returning(Transaction.id, sort_by_parameter_order=True),
+        transactions
+    ).all()
+    for transaction, transaction_id in zip(transactions, transaction_ids):
+        transaction["id"] = transaction_id
+    transaction_details = [
+        {
+            "transaction_id": transaction_ids[tx_idx],
+            "product_id": products[product_idx].id,
+            "cantidad": cantidad,
+            "precio_unitario": precio_unitario
+        }
+        for tx_idx, product_idx, cantidad, precio_unitario in zip(
+            detail_tx_idxs, detail_product_idxs, cantidades, to_decimals(unit_prices)
+        )
+    ]
+    insert_rows(session, TransactionDetail, transaction_details)
     print(f"🛒 {len(transactions)} transacciones y {len(transaction_details)} detalles creados")
     return transactions, transaction_details
 
 def seed_predictions(session, products):
     """Create ML predictions for products"""
     models = ['linear_regression', 'random_forest', 'neural_network', 'arima']
-    predictions = []
+    pairs = []
     
-    for product in products:
-        # Create 2-4 predictions per product with different models
-        num_predictions = random.randint(2, 4)
-        selected_models = random.sample(models, num_predictions)
-        
-        for model in selected_models:
-            # Prediction result around ±20% of base price
-            base_price = float(product.precio_base)
-            prediction_result = base_price * random.uniform(0.8, 1.2)
-            
-            prediction = Prediction(
-                product_id=product.id,
-                modelo=model,
-                resultado=Decimal(str(round(prediction_result, 2))),
-                fecha=fake.date_time_between(start_date='-30d', end_date='now')
-            )
-            predictions.append(prediction)
-            session.add(prediction)
+    # Create 2-4 predictions per product with different models
+    predictions_per_product = rng.integers(2, 5, len(products)).tolist()
+    for product_idx, num_predictions in enumerate(predictions_per_product):
+        for model in random.sample(models, num_predictions):
+            pairs.append((product_idx, model))
+    
+    # Prediction result around ±20% of base price
+    base_prices = np.array([float(product.precio_base) for product in products])
+    product_idxs = np.fromiter((product_idx for product_idx, _ in pairs), dtype=np.intp, count=len(pairs))
+    results = to_decimals((np.take(base_prices, product_idxs) * rng.uniform(0.8, 1.2, len(pairs))).round(2))
+    fechas = random_datetimes(datetime.now() - timedelta(days=30), len(pairs))
     
-    session.commit()
+    predictions = [
+        {
+            "product_id": products[product_idx].id,
+            "modelo": model,
+            "resultado": resultado,
+            "fecha": fecha
+        }
+        for (product_idx, model), resultado, fecha in zip(pairs, results, fechas)
+    ]
+    
+    insert_rows(session, Prediction, predictions)
     print(f"🔮 {len(predictions)} predicciones creadas")
     return predictions
 
@@ -380,22 +474,19 @@ def seed_chat_logs(session, users):
         "El análisis de competencia muestra que..."
     ]
     
-    chat_logs = []
+    # Create 5-15 chat logs per user; messages and responses sampled in batch
+    chats_per_user = rng.integers(5, 16, len(users)).tolist()
+    total_chats = sum(chats_per_user)
+    mensajes = random.choices(sample_messages, k=total_chats)
+    respuestas = random.choices(sample_responses, k=total_chats)
+    user_ids = [user["id"] for user, num_chats in zip(users, chats_per_user) for _ in range(num_chats)]
     
-    for user in users:
-        # Create 5-15 chat logs per user
-        num_chats = random.randint(5, 15)
-        
-        for _ in range(num_chats):
-            chat_log = ChatLog(
-                user_id=user.id,
-                mensaje=random.choice(sample_messages),
-                respuesta=random.choice(sample_responses)
-            )
-            chat_logs.append(chat_log)
-            session.add(chat_log)
+    chat_logs = [
+        {"user_id": user_id, "mensaje": mensaje, "respuesta": respuesta}
+        for user_id, mensaje, respuesta in zip(user_ids, mensajes, respuestas)
+    ]
     
-    session.commit()
+    insert_rows(session, ChatLog, chat_logs)
     print(f"💬 {len(chat_logs)} logs de chat creados")
     return chat_logs
 
@@ -406,49 +497,50 @@ def main():
     # Create tables
     create_tables()
     
-    # Create session
-    session = SessionLocal()
-    
     try:
-        # Clear existing data
-        clear_data(session)
-        
-        # Seed data in order of dependencies
-        print("\n📊 Creando datos ficticios...")
-        
-        businesses = seed_businesses(session)
-        users = seed_users(session, businesses)
-        categories = seed_categories(session)
-        suppliers = seed_suppliers(session)
-        products = seed_products(session, businesses, categories)
-        inventories = seed_inventory(session, products)
-        supplier_prices = seed_supplier_prices(session, products, suppliers)
-        transactions, transaction_details = seed_transactions(session, businesses, products)
-        predictions = seed_predictions(session, products)
-        chat_logs = seed_chat_logs(session, users)
-        
-        print("\n✅ ¡Datos ficticios creados exitosamente!")
-        print("\n📈 Resumen:")
-        print(f"   • {len(businesses)} negocios")
-        print(f"   • {len(users)} usuarios")
-        print(f"   • {len(categories)} categorías")
-        print(f"   • {len(suppliers)} proveedores")
-        print(f"   • {len(products)} productos")
-        print(f"   • {len(inventories)} registros de inventario")
-        print(f"   • {len(supplier_prices)} precios de proveedores")
-        print(f"   • {len(transactions)} transacciones")
-        print(f"   • {len(transaction_details)} detalles de transacciones")
-        print(f"   • {len(predictions)} predicciones")
-        print(f"   • {len(chat_logs)} logs de chat")
-        
-        print("\n🎉 ¡La base de datos está lista para usar!")
-        
+        # One explicit transaction for the whole run: session.begin() commits
+        # once when the block ends and rolls everything back if a seeder fails
+        with SessionLocal() as session, session.begin():
+            # Clear existing data
+            clear_data(session)
+            
+            # Seed data in order of dependencies
+            print("\n📊 Creando datos ficticios...")
+            
+            # The three parent tables do not depend on each other: they are
+            # added first and inserted by a single flush, which also fills in
+            # the IDs needed by users, products, transactions and prices
+            businesses = seed_businesses(session)
+            categories = seed_categories(session)
+            suppliers = seed_suppliers(session)
+            session.flush()
+            
+            users = seed_users(session, businesses)
+            products = seed_products(session, businesses, categories)
+            inventories = seed_inventory(session, products)
+            supplier_prices = seed_supplier_prices(session, products, suppliers)
+            transactions, transaction_details = seed_transactions(session, businesses, products)
+            predictions = seed_predictions(session, products)
+            chat_logs = seed_chat_logs(session, users)
     except Exception as e:
         print(f"❌ Error durante la inyección de datos: {e}")
-        session.rollback()
         raise
-    finally:
-        session.close()
+    
+    print("\n✅ ¡Datos ficticios creados exitosamente!")
+    print("\n📈 Resumen:")
+    print(f"   • {len(businesses)} negocios")
+    print(f"   • {len(users)} usuarios")
+    print(f"   • {len(categories)} categorías")
+    print(f"   • {len(suppliers)} proveedores")
+    print(f"   • {len(products)} productos")
+    print(f"   • {len(inventories)} registros de inventario")
+    print(f"   • {len(supplier_prices)} precios de proveedores")
+    print(f"   • {len(transactions)} transacciones")
+    print(f"   • {len(transaction_details)} detalles de transacciones")
+    print(f"   • {len(predictions)} predicciones")
+    print(f"   • {len(chat_logs)} logs de chat")
+    
+    print("\n🎉 ¡La base de datos está lista para usar!")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
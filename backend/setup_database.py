@@ -1,13 +1,18 @@
 import sys
 import os
+import importlib.util
 import subprocess
 from pathlib import Path
 
 def install_dependencies():
     """Install required dependencies for seeding"""
+    # Skip the pip subprocess entirely when faker is already importable
+    if importlib.util.find_spec("faker") is not None:
+        print("✅ Dependencias ya instaladas")
+        return True
+    
     print("Instalando dependencias necesarias...")
     try:
-        # Install faker if not already installed
         subprocess.check_call([sys.executable, "-m", "pip", "install", "faker==19.12.0"])
         print("✅ Dependencias instaladas correctamente")
     except subprocess.CalledProcessError as e:
@@ -45,7 +50,7 @@ def run_seed_data():
         print(f"❌ Error inyectando datos: {e}")
         return False
 
-def main():
+def main(seed=True):
     """Main setup function"""
     print("CONFIGURACIÓN COMPLETA DE BASE DE DATOS")
     print("=" * 50)
@@ -65,7 +70,7 @@ def main():
         return 1
     
     # Step 3: Seed with sample data
-    if not run_seed_data():
+    if seed and not run_seed_data():
         print("❌ Falló la inyección de datos ficticios")
         return 1
     
@@ -74,10 +79,17 @@ def main():
     print("\n Resumen de lo que se ha configurado:")
     print("   ✅ Dependencias instaladas")
     print("   ✅ Base de datos inicializada")
-    print("   ✅ Datos ficticios inyectados")
+    if seed:
+        print("   ✅ Datos ficticios inyectados")
     print("\n Tu aplicación está lista para usar con datos realistas")
 
     return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Configuración completa de la base de datos')
+    parser.add_argument('--no-seed', action='store_true', help='Crear las tablas sin volver a inyectar datos ficticios')
+    
+    args = parser.parse_args()
+    sys.exit(main(seed=not args.no_seed))
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""
+Caché L2 compartida entre workers (Redis)
+
+Es opcional: sólo se activa si existe la variable de entorno REDIS_URL y el
+paquete `redis` está instalado. Sin ella, todas las operaciones son no-op y
+las rutas siguen funcionando con su caché local por proceso.
+
+La invalidación se dispara con eventos de SQLAlchemy: al actualizar o eliminar
+una fila se anota su clave en la sesión y se borra de Redis tras el commit.
+"""
+import asyncio
+import logging
+import os
+from typing import Callable, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+try:
+    import redis
+    import redis.asyncio as redis_async
+except ImportError:  # pragma: no cover - dependencia opcional
+    redis = redis_async = None
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL")
+SHARED_CACHE_TTL = int(os.getenv("SHARED_CACHE_TTL", "300"))
+
+_client = redis_async.from_url(REDIS_URL) if redis_async is not None and REDIS_URL else None
+
+# Claves a invalidar cuando la sesión confirme la transacción
+_PENDING_KEY = "shared_cache_invalidate"
+# Referencias a las tareas de borrado en curso para que no las recoja el GC
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def is_enabled() -> bool:
+    """Indica si hay un servidor Redis configurado."""
+    return _client is not None
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Devuelve el valor guardado en `key`, o None si no existe o Redis falla."""
+    if _client is None:
+        return None
+    try:
+        return await _client.get(key)
+    except Exception as e:
+        logger.warning("Error leyendo %s de Redis: %s", key, e)
+        return None
+
+
+async def cache_set(key: str, value: bytes, ttl: int = SHARED_CACHE_TTL) -> None:
+    """Guarda `value` en `key` con expiración de `ttl` segundos."""
+    if _client is None:
+        return
+    try:
+        await _client.setex(key, ttl, value)
+    except Exception as e:
+        logger.warning("Error escribiendo %s en Redis: %s", key, e)
+
+
+async def cache_delete(*keys: str) -> None:
+    """Elimina las claves indicadas."""
+    if _client is None or not keys:
+        return
+    try:
+        await _client.delete(*keys)
+    except Exception as e:
+        logger.warning("Error invalidando %s en Redis: %s", keys, e)
+
+
+def invalidate_on_change(model, key_for: Callable[[object], str]) -> None:
+    """
+    Registra eventos para invalidar la caché cuando cambia una fila de `model`.
+
+    Args:
+        model: Clase mapeada de SQLAlchemy
+        key_for: Función que construye la clave de caché a partir de la instancia
+    """
+    if _client is None:
+        return
+
+    def _mark(mapper, connection, target):
+        session = object_session(target)
+        if session is not None:
+            session.info.setdefault(_PENDING_KEY, set()).add(key_for(target))
+
+    event.listen(model, "after_update", _mark)
+    event.listen(model, "after_delete", _mark)
+    if not event.contains(Session, "after_commit", _flush_invalidations):
+        event.listen(Session, "after_commit", _flush_invalidations)
+        event.listen(Session, "after_rollback", _discard_invalidations)
+
+
+def _flush_invalidations(session):
+    keys = session.info.pop(_PENDING_KEY, None)
+    if not keys:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Sesión síncrona fuera del bucle de eventos (scripts, seeds)
+        try:
+            redis.Redis.from_url(REDIS_URL).delete(*keys)
+        except Exception as e:
+            logger.warning("Error invalidando %s en Redis: %s", keys, e)
+        return
+    task = loop.create_task(cache_delete(*keys))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _discard_invalidations(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,23 @@
+"""
+Utilidades para enviar listados grandes como JSON en streaming
+"""
+from typing import Iterable, Iterator
+
+from pydantic import BaseModel
+
+
+def json_array_stream(models: Iterable[BaseModel]) -> Iterator[bytes]:
+    """
+    Serializa los modelos uno a uno como un array JSON.
+    
+    Los bytes se emiten a medida que llegan las filas, de modo que la memoria
+    por petición queda acotada a una fila en lugar de la lista completa.
+    """
+    yield b"["
+    first = True
+    for model in models:
+        if not first:
+            yield b","
+        first = False
+        yield model.model_dump_json().encode()
+    yield b"]"
@@ -1,6 +1,7 @@
 """
 Esquema de comunicación entre el chatbot y el backend para ejecutar modelos ML
 """
+import re
 from typing import Dict, List, Any, Optional, Union
 from pydantic import BaseModel, Field
 from datetime import datetime
@@ -84,7 +85,9 @@ class ChatContext(BaseModel):
     active_filters: Dict[str, Any] = Field(default_factory=dict)
     last_model_action: Optional[ModelAction] = Field(None)
     created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    # Un contexto nuevo se actualizó al crearse: reutiliza created_at en lugar de
+    # llamar otra vez a datetime.now()
+    updated_at: datetime = Field(default_factory=lambda data: data['created_at'])
 
 class IntentClassification(BaseModel):
     """Clasificación de intención del usuario"""
@@ -110,7 +113,55 @@ class ErrorResponse(BaseModel):
     details: Optional[Dict[str, Any]] = Field(None, description="Detalles adicionales")
     suggestions: List[str] = Field(default_factory=list, description="Sugerencias para resolver")
 
+# Palabras clave -> (acción, parámetros, intención) para create_model_request,
+# evaluadas en este orden
+_MODEL_REQUEST_RULES = (
+    (("predic", "demanda"), ModelAction.PREDICT_DEMAND, {"dias_adelante": 7}, "prediction"),
+    (("compar", "modelo"), ModelAction.COMPARE_MODELS, {}, "comparison"),
+    (("inventario", "stock"), ModelAction.GET_INVENTORY_STATUS, {}, "inventory"),
+)
+
+def _format_prediction(model_response: ModelResponse) -> tuple[str, List[str]]:
+    """Mensaje y sugerencias para una predicción de demanda"""
+    predictions = model_response.data.get('predicciones', [])
+    message = f"📈 Predicción de demanda:\n"
+    message += f"• Promedio próximos días: {sum(predictions)/len(predictions):.1f} unidades\n"
+    message += f"• Modelo usado: {model_response.data.get('mejor_modelo', 'N/A')}\n"
+    message += f"• Confianza: {model_response.confidence*100:.1f}%"
+    
+    suggestions = [
+        "¿Quieres ver la comparación de modelos?",
+        "¿Te interesa analizar las tendencias?",
+        "¿Necesitas optimizar el inventario?"
+    ]
+    return message, suggestions
+
+def _format_comparison(model_response: ModelResponse) -> tuple[str, List[str]]:
+    """Mensaje y sugerencias para una comparación de modelos"""
+    best_model = model_response.data.get('mejor_modelo', 'N/A')
+    r2_score = model_response.data.get('mejor_r2', 0)
+    message = f"🔍 Comparación de modelos:\n"
+    message += f"• Mejor modelo: {best_model}\n"
+    message += f"• Precisión (R²): {r2_score:.3f}\n"
+    message += f"• Tiempo de ejecución: {model_response.execution_time:.2f}s"
+    
+    suggestions = [
+        "¿Quieres hacer una predicción con este modelo?",
+        "¿Te gustaría ver más detalles técnicos?",
+        "¿Necesitas entrenar un nuevo modelo?"
+    ]
+    return message, suggestions
+
+# Acción -> formateador de su respuesta (una búsqueda en lugar de la cadena de if/elif)
+_RESPONSE_FORMATTERS = {
+    ModelAction.PREDICT_DEMAND: _format_prediction,
+    ModelAction.COMPARE_MODELS: _format_comparison,
+}
+
 # Esquema de comunicación específico
+# Las solicitudes, respuestas e intenciones que arman las clases siguientes usan
+# sólo datos propios (enums, literales, modelos ya validados), por eso se crean
+# con model_construct, sin volver a validarlas
 class ChatCommunicationProtocol:
     """Protocolo de comunicación entre chatbot y backend"""
     
@@ -120,72 +171,35 @@ class ChatCommunicationProtocol:
         # Aquí iría la lógica de procesamiento de lenguaje natural
         # Por ahora, implementamos una versión simplificada
         
-        # Detección de intenciones básicas
-        if "predic" in user_message.lower() or "demanda" in user_message.lower():
-            return ModelRequest(
-                action=ModelAction.PREDICT_DEMAND,
-                parameters={"dias_adelante": 7},
-                context=user_message,
-                user_intent="prediction"
-            )
-        elif "compar" in user_message.lower() or "modelo" in user_message.lower():
-            return ModelRequest(
-                action=ModelAction.COMPARE_MODELS,
-                parameters={},
-                context=user_message,
-                user_intent="comparison"
-            )
-        elif "inventario" in user_message.lower() or "stock" in user_message.lower():
-            return ModelRequest(
-                action=ModelAction.GET_INVENTORY_STATUS,
-                parameters={},
-                context=user_message,
-                user_intent="inventory"
-            )
+        # Detección de intenciones básicas: el mensaje se pasa a minúsculas una
+        # vez y se recorre la tabla en orden hasta la primera coincidencia
+        message_lower = user_message.lower()
+        for keywords, action, parameters, user_intent in _MODEL_REQUEST_RULES:
+            if any(keyword in message_lower for keyword in keywords):
+                break
         else:
-            return ModelRequest(
-                action=ModelAction.GENERATE_REPORT,
-                parameters={"type": "general"},
-                context=user_message,
-                user_intent="general"
-            )
+            action, parameters, user_intent = ModelAction.GENERATE_REPORT, {"type": "general"}, "general"
+        
+        return ModelRequest.model_construct(
+            action=action,
+            parameters=dict(parameters),  # copia: la tabla es compartida
+            context=user_message,
+            user_intent=user_intent
+        )
     
     @staticmethod
     def format_model_response(model_response: ModelResponse, user_intent: str) -> ChatbotResponse:
         """Formatea la respuesta del modelo para el chatbot"""
         if model_response.success:
-            if model_response.action == ModelAction.PREDICT_DEMAND:
-                predictions = model_response.data.get('predicciones', [])
-                message = f"📈 Predicción de demanda:\n"
-                message += f"• Promedio próximos días: {sum(predictions)/len(predictions):.1f} unidades\n"
-                message += f"• Modelo usado: {model_response.data.get('mejor_modelo', 'N/A')}\n"
-                message += f"• Confianza: {model_response.confidence*100:.1f}%"
-                
-                suggestions = [
-                    "¿Quieres ver la comparación de modelos?",
-                    "¿Te interesa analizar las tendencias?",
-                    "¿Necesitas optimizar el inventario?"
-                ]
-                
-            elif model_response.action == ModelAction.COMPARE_MODELS:
-                best_model = model_response.data.get('mejor_modelo', 'N/A')
-                r2_score = model_response.data.get('mejor_r2', 0)
-                message = f"🔍 Comparación de modelos:\n"
-                message += f"• Mejor modelo: {best_model}\n"
-                message += f"• Precisión (R²): {r2_score:.3f}\n"
-                message += f"• Tiempo de ejecución: {model_response.execution_time:.2f}s"
-                
-                suggestions = [
-                    "¿Quieres hacer una predicción con este modelo?",
-                    "¿Te gustaría ver más detalles técnicos?",
-                    "¿Necesitas entrenar un nuevo modelo?"
-                ]
-                
+            # Formateador específico de la acción, o el mensaje genérico del modelo
+            formatter = _RESPONSE_FORMATTERS.get(model_response.action)
+            if formatter is not None:
+                message, suggestions = formatter(model_response)
             else:
                 message = model_response.message
                 suggestions = model_response.recommendations
             
-            return ChatbotResponse(
+            return ChatbotResponse.model_construct(
                 message=message,
                 model_results=model_response,
                 suggestions=suggestions,
@@ -196,7 +210,7 @@ class ChatCommunicationProtocol:
                 ]
             )
         else:
-            return ChatbotResponse(
+            return ChatbotResponse.model_construct(
                 message=f"❌ Error al ejecutar {model_response.action}: {model_response.message}",
                 type=ChatMessageType.ERROR,
                 suggestions=[
@@ -206,6 +220,28 @@ class ChatCommunicationProtocol:
                 ]
             )
 
+# Patrones compilados una sola vez al importar el módulo
+_PRODUCT_ID_RE = re.compile(r'producto\s*(\d+)|id\s*(\d+)')
+_DAYS_RE = re.compile(r'(\d+)\s*días?')
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4}')
+
+# Palabras clave para diferentes intenciones (el orden de las intenciones
+# decide los empates)
+_INTENT_KEYWORDS = {
+    'prediction': ['predic', 'demanda', 'forecast', 'estima', 'proyecc'],
+    'comparison': ['compar', 'modelo', 'mejor', 'evalua', 'rendimiento'],
+    'inventory': ['inventario', 'stock', 'almacen', 'existencia'],
+    'analysis': ['analiz', 'tendencia', 'reporte', 'estadistica']
+}
+# Cada palabra se busca por separado con `in`: una sola alternancia recorrida con
+# findall consumiría las coincidencias solapadas ("predicompar") y dejaría
+# palabras clave sin contar
+_KEYWORD_INTENTS = tuple(
+    (keyword, intent)
+    for intent, keywords in _INTENT_KEYWORDS.items()
+    for keyword in keywords
+)
+
 # Utilidades para el procesamiento
 class MessageProcessor:
     """Procesador de mensajes del chat"""
@@ -213,21 +249,21 @@ class MessageProcessor:
     @staticmethod
     def extract_entities(message: str) -> Dict[str, Any]:
         """Extrae entidades del mensaje (producto_id, fechas, etc.)"""
-        import re
         entities = {}
+        message_lower = message.lower()
         
         # Extraer IDs de producto
-        product_ids = re.findall(r'producto\s*(\d+)|id\s*(\d+)', message.lower())
-        if product_ids:
-            entities['producto_id'] = int(product_ids[0][0] or product_ids[0][1])
+        product_id = _PRODUCT_ID_RE.search(message_lower)
+        if product_id:
+            entities['producto_id'] = int(product_id.group(1) or product_id.group(2))
         
         # Extraer números de días
-        days = re.findall(r'(\d+)\s*días?', message.lower())
+        days = _DAYS_RE.search(message_lower)
         if days:
-            entities['dias'] = int(days[0])
+            entities['dias'] = int(days.group(1))
         
         # Extraer rangos de fechas
-        dates = re.findall(r'\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4}', message)
+        dates = _DATE_RE.findall(message)
         if dates:
             entities['fechas'] = dates
         
@@ -238,31 +274,18 @@ class MessageProcessor:
         """Clasifica la intención del mensaje"""
         message_lower = message.lower()
         
-        # Palabras clave para diferentes intenciones
-        prediction_keywords = ['predic', 'demanda', 'forecast', 'estima', 'proyecc']
-        comparison_keywords = ['compar', 'modelo', 'mejor', 'evalua', 'rendimiento']
-        inventory_keywords = ['inventario', 'stock', 'almacen', 'existencia']
-        analysis_keywords = ['analiz', 'tendencia', 'reporte', 'estadistica']
-        
-        # Calcular scores
-        prediction_score = sum(1 for keyword in prediction_keywords if keyword in message_lower)
-        comparison_score = sum(1 for keyword in comparison_keywords if keyword in message_lower)
-        inventory_score = sum(1 for keyword in inventory_keywords if keyword in message_lower)
-        analysis_score = sum(1 for keyword in analysis_keywords if keyword in message_lower)
-        
-        scores = {
-            'prediction': prediction_score,
-            'comparison': comparison_score,
-            'inventory': inventory_score,
-            'analysis': analysis_score
-        }
+        # Calcular scores: cada palabra clave encontrada suma 1 a su intención
+        scores = dict.fromkeys(_INTENT_KEYWORDS, 0)
+        for keyword, intent in _KEYWORD_INTENTS:
+            if keyword in message_lower:
+                scores[intent] += 1
         
         # Determinar intención principal
         max_intent = max(scores, key=scores.get)
         max_score = scores[max_intent]
         
         if max_score == 0:
-            return IntentClassification(
+            return IntentClassification.model_construct(
                 intent="general",
                 confidence=0.5,
                 entities=MessageProcessor.extract_entities(message),
@@ -279,7 +302,7 @@ class MessageProcessor:
             'analysis': ModelAction.ANALYZE_TRENDS
         }
         
-        return IntentClassification(
+        return IntentClassification.model_construct(
             intent=max_intent,
             confidence=confidence,
             entities=MessageProcessor.extract_entities(message),
@@ -4,8 +4,10 @@ Conecta con Ollama ejecutándose en Google Colab a través de ngrok
 """
 import asyncio
 import aiohttp
-import json
-from typing import Dict, List, Any, Optional, AsyncGenerator
+import orjson
+from collections import deque
+from itertools import islice
+from typing import Dict, List, Any, Optional, AsyncGenerator, Tuple
 from datetime import datetime
 import logging
 from pydantic import BaseModel
@@ -14,6 +16,38 @@ from pydantic import BaseModel
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Intercambios guardados por sesión y cuántos de ellos se envían en el prompt:
+# la ventana acota los tokens del prompt y con ello la latencia de Ollama
+HISTORY_WINDOW = 10
+PROMPT_HISTORY_TURNS = 3
+
+# Descripción de las capacidades de ML que se antepone a los prompts
+_ML_CONTEXT_PROMPT = """
+            Contexto: Tienes acceso a un sistema de ML con las siguientes capacidades:
+            
+            1. PREDICCIÓN DE DEMANDA:
+               - Predice ventas futuras de productos específicos
+               - Usa múltiples modelos (lineal, polinómico)
+               - Comando: predict_demand(producto_id, dias)
+            
+            2. COMPARACIÓN DE MODELOS:
+               - Evalúa rendimiento de diferentes modelos
+               - Proporciona métricas de precisión
+               - Comando: compare_models(producto_id)
+            
+            3. ANÁLISIS DE INVENTARIO:
+               - Estado actual de stock
+               - Recomendaciones de reposición
+               - Comando: inventory_status(producto_id)
+            
+            4. ANÁLISIS DE TENDENCIAS:
+               - Patrones de venta históricos
+               - Estacionalidad y tendencias
+               - Comando: analyze_trends(producto_id, periodo)
+            
+            Cuando el usuario pregunte algo que requiera estos análisis, menciona que puedes ejecutar el análisis correspondiente.
+            """
+
 class OllamaConfig(BaseModel):
     """Configuración para Ollama"""
     base_url: str = "https://cef121c12d20.ngrok-free.app/"
@@ -36,29 +70,70 @@ class OllamaClient:
     def __init__(self, config: OllamaConfig = None):
         self.config = config or OllamaConfig()
         self.conversation_context = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
     
-    async def check_connection(self) -> bool:
-        """Verifica si Ollama está disponible"""
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Devuelve la sesión HTTP del cliente, creándola la primera vez"""
+        # Una sola sesión con pool de conexiones keep-alive evita repetir el
+        # handshake TCP/TLS con el túnel ngrok en cada petición. Se recrea si el
+        # bucle de eventos cambió (p. ej. cada asyncio.run de Streamlit)
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._session_loop is not loop:
+            await self._discard_session()
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+            self._session_loop = loop
+        return self._session
+    
+    async def _discard_session(self):
+        """Libera una sesión creada en un bucle de eventos anterior"""
+        stale, self._session, self._session_loop = self._session, None, None
+        try:
+            await stale.close()
+        except Exception:
+            # El bucle original ya está cerrado y sus transportes no pueden
+            # cerrarse desde este; se desvincula el conector para no dejar
+            # la sesión abierta
+            stale.detach()
+    
+    async def close(self):
+        """Cierra la sesión HTTP y sus conexiones"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def get_status(self) -> Tuple[bool, List[str]]:
+        """Verifica si Ollama está disponible y lista sus modelos con una sola petición"""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.config.base_url}/api/tags", timeout=aiohttp.ClientTimeout(total=self.config.timeout)) as response:
-                    return response.status == 200
+            session = await self._get_session()
+            async with session.get(f"{self.config.base_url}/api/tags", timeout=aiohttp.ClientTimeout(total=self.config.timeout)) as response:
+                if response.status != 200:
+                    return False, []
+                data = orjson.loads(await response.read())
+                return True, [model["name"] for model in data.get("models", [])]
         except Exception as e:
             logger.error(f"Error conectando con Ollama: {e}")
-            return False
+            return False, []
+    
+    async def check_connection(self) -> bool:
+        """Verifica si Ollama está disponible"""
+        is_healthy, _ = await self.get_status()
+        return is_healthy
     
     async def list_models(self) -> List[str]:
         """Lista los modelos disponibles en Ollama"""
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.config.base_url}/api/tags", timeout=aiohttp.ClientTimeout(total=self.config.timeout)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return [model["name"] for model in data.get("models", [])]
-                    return []
-        except Exception as e:
-            logger.error(f"Error obteniendo modelos: {e}")
-            return []
+        _, models = await self.get_status()
+        return models
     
     async def generate_response(
         self, 
@@ -83,26 +158,26 @@ class OllamaClient:
                 }
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.config.base_url}/api/generate",
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                    timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-                ) as response:
-                    
-                    if response.status == 200:
-                        response_data = await response.json()
-                        
-                        # Guardar contexto de conversación
-                        if session_id:
-                            self._update_conversation_context(session_id, prompt, response_data.get('response', ''))
-                        
-                        return response_data.get('response', 'No hay respuesta disponible.')
-                    else:
-                        logger.error(f"Error en Ollama: {response.status} - {await response.text()}")
-                        return "Lo siento, hay un problema con el servicio de chat. Intenta de nuevo."
+            session = await self._get_session()
+            async with session.post(
+                f"{self.config.base_url}/api/generate",
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+            ) as response:
                 
+                if response.status == 200:
+                    response_data = orjson.loads(await response.read())
+                    
+                    # Guardar contexto de conversación
+                    if session_id:
+                        self._update_conversation_context(session_id, prompt, response_data.get('response', ''))
+                    
+                    return response_data.get('response', 'No hay respuesta disponible.')
+                else:
+                    logger.error(f"Error en Ollama: {response.status} - {await response.text()}")
+                    return "Lo siento, hay un problema con el servicio de chat. Intenta de nuevo."
+            
         except Exception as e:
             logger.error(f"Error generando respuesta: {e}")
             return "Disculpa, no pude procesar tu mensaje en este momento."
@@ -127,69 +202,50 @@ class OllamaClient:
                 }
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.config.base_url}/api/generate",
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                    timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-                ) as response:
-                    if response.status == 200:
-                        async for line in response.content:
-                            if line:
-                                try:
-                                    data = json.loads(line.decode('utf-8'))
-                                    if 'response' in data:
-                                        yield data['response']
-                                    if data.get('done', False):
-                                        break
-                                except json.JSONDecodeError:
-                                    continue
-                    else:
-                        yield "Error en el servicio de chat."
-                        
+            session = await self._get_session()
+            async with session.post(
+                f"{self.config.base_url}/api/generate",
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+            ) as response:
+                if response.status == 200:
+                    parts = []
+                    async for line in response.content:
+                        if line:
+                            try:
+                                # orjson lee los bytes de cada línea NDJSON sin decodificarlos antes
+                                data = orjson.loads(line)
+                                if 'response' in data:
+                                    parts.append(data['response'])
+                                    yield data['response']
+                                if data.get('done', False):
+                                    break
+                            except orjson.JSONDecodeError:
+                                continue
+                    
+                    # Guardar la respuesta completa en el contexto, igual que generate_response
+                    if session_id:
+                        self._update_conversation_context(session_id, prompt, "".join(parts))
+                else:
+                    yield "Error en el servicio de chat."
+                    
         except Exception as e:
             logger.error(f"Error en stream: {e}")
             yield "Error en la conexión."
     
     def _build_prompt(self, user_prompt: str, session_id: str = None, include_ml_context: bool = True) -> str:
         """Construye el prompt completo con contexto"""
-        prompt_parts = []
-        
-        # Contexto de ML si está habilitado
-        if include_ml_context:
-            ml_context = """
-            Contexto: Tienes acceso a un sistema de ML con las siguientes capacidades:
-            
-            1. PREDICCIÓN DE DEMANDA:
-               - Predice ventas futuras de productos específicos
-               - Usa múltiples modelos (lineal, polinómico)
-               - Comando: predict_demand(producto_id, dias)
-            
-            2. COMPARACIÓN DE MODELOS:
-               - Evalúa rendimiento de diferentes modelos
-               - Proporciona métricas de precisión
-               - Comando: compare_models(producto_id)
-            
-            3. ANÁLISIS DE INVENTARIO:
-               - Estado actual de stock
-               - Recomendaciones de reposición
-               - Comando: inventory_status(producto_id)
-            
-            4. ANÁLISIS DE TENDENCIAS:
-               - Patrones de venta históricos
-               - Estacionalidad y tendencias
-               - Comando: analyze_trends(producto_id, periodo)
-            
-            Cuando el usuario pregunte algo que requiera estos análisis, menciona que puedes ejecutar el análisis correspondiente.
-            """
-            prompt_parts.append(ml_context)
+        # Contexto de ML si está habilitado (texto fijo, definido una vez en el módulo)
+        prompt_parts = [_ML_CONTEXT_PROMPT] if include_ml_context else []
         
         # Contexto de conversación previa
-        if session_id and session_id in self.conversation_context:
-            context = self.conversation_context[session_id]
+        context = self.conversation_context.get(session_id) if session_id else None
+        if context is not None:
             if context["messages"]:
-                recent_messages = context["messages"][-3:]  # Últimos 3 intercambios
+                # Últimos intercambios leídos directamente del deque, sin copiarlo a una lista
+                messages = context["messages"]
+                recent_messages = islice(messages, max(0, len(messages) - PROMPT_HISTORY_TURNS), None)
                 conversation_history = "\n".join([
                     f"Usuario: {msg['user']}\nAsistente: {msg['assistant']}"
                     for msg in recent_messages
@@ -197,29 +253,28 @@ class OllamaClient:
                 prompt_parts.append(f"Conversación previa:\n{conversation_history}")
         
         # Prompt del usuario
-        prompt_parts.append(f"Usuario: {user_prompt}")
-        prompt_parts.append("Asistente:")
+        prompt_parts.append(f"Usuario: {user_prompt}\n\nAsistente:")
         
         return "\n\n".join(prompt_parts)
     
     def _update_conversation_context(self, session_id: str, user_message: str, assistant_response: str):
         """Actualiza el contexto de la conversación"""
-        if session_id not in self.conversation_context:
-            self.conversation_context[session_id] = {
-                "created_at": datetime.now(),
-                "messages": []
+        now = datetime.now()
+        # Una sola búsqueda en el diccionario; el contexto sólo se crea si falta
+        # (setdefault construiría el dict y el deque en cada llamada)
+        context = self.conversation_context.get(session_id)
+        if context is None:
+            context = self.conversation_context[session_id] = {
+                "created_at": now,
+                # deque con maxlen descarta el intercambio más antiguo al añadir uno nuevo
+                "messages": deque(maxlen=HISTORY_WINDOW)
             }
         
-        self.conversation_context[session_id]["messages"].append({
+        context["messages"].append({
             "user": user_message,
             "assistant": assistant_response,
-            "timestamp": datetime.now()
+            "timestamp": now
         })
-        
-        # Mantener solo los últimos 10 intercambios
-        if len(self.conversation_context[session_id]["messages"]) > 10:
-            self.conversation_context[session_id]["messages"] = \
-                self.conversation_context[session_id]["messages"][-10:]
     
     def update_ollama_url(self, new_url: str):
         """Actualiza la URL de Ollama (para cuando cambie el túnel ngrok)"""
@@ -241,24 +296,31 @@ class OllamaManager:
     
     async def health_check(self) -> Dict[str, Any]:
         """Verifica el estado de todos los clientes"""
-        results = {}
-        for name, client in self.clients.items():
-            try:
-                is_healthy = await client.check_connection()
-                models = await client.list_models() if is_healthy else []
-                results[name] = {
-                    "status": "healthy" if is_healthy else "unhealthy",
-                    "url": client.config.base_url,
-                    "models": models,
-                    "timestamp": datetime.now().isoformat()
-                }
-            except Exception as e:
-                results[name] = {
-                    "status": "error",
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat()
-                }
-        return results
+        # Los clientes se consultan en paralelo: el tiempo total es el del más
+        # lento en lugar de la suma de todos
+        results = await asyncio.gather(*(
+            self._probe(name, client) for name, client in self.clients.items()
+        ))
+        return dict(results)
+    
+    @staticmethod
+    async def _probe(name: str, client: OllamaClient) -> tuple:
+        """Verifica el estado de un cliente"""
+        try:
+            # /api/tags responde a la vez si el servidor está vivo y sus modelos
+            is_healthy, models = await client.get_status()
+            return name, {
+                "status": "healthy" if is_healthy else "unhealthy",
+                "url": client.config.base_url,
+                "models": models,
+                "timestamp": datetime.now().isoformat()
+            }
+        except Exception as e:
+            return name, {
+                "status": "error",
+                "error": str(e),
+                "timestamp": datetime.now().isoformat()
+            }
     
     def update_url(self, new_url: str, config_name: str = "default"):
         """Actualiza la URL para un cliente específico"""
@@ -268,23 +330,29 @@ class OllamaManager:
             # Crear nuevo cliente con la nueva URL
             new_config = OllamaConfig(base_url=new_url)
             self.clients[config_name] = OllamaClient(new_config)
+    
+    async def close(self):
+        """Cierra las sesiones HTTP de todos los clientes"""
+        await asyncio.gather(*(client.close() for client in self.clients.values()))
 
 # Instancia global del manager
 ollama_manager = OllamaManager()
 
 # Funciones de utilidad
+# Comparten el cliente del manager y su sesión HTTP: no la cierran al terminar,
+# porque otra llamada del mismo bucle puede estar usándola. Si cada llamada
+# llega con un bucle nuevo (asyncio.run), _get_session libera la sesión anterior;
+# quien controle el ciclo de vida del proceso llama a ollama_manager.close() al apagar
 async def get_ollama_response(prompt: str, session_id: str = None) -> str:
     """Función de conveniencia para obtener respuesta de Ollama"""
     client = ollama_manager.get_client()
-    async with client:
-        return await client.generate_response(prompt, session_id)
+    return await client.generate_response(prompt, session_id)
 
 async def stream_ollama_response(prompt: str, session_id: str = None):
     """Función de conveniencia para streaming"""
     client = ollama_manager.get_client()
-    async with client:
-        async for chunk in client.stream_response(prompt, session_id):
-            yield chunk
+    async for chunk in client.stream_response(prompt, session_id):
+        yield chunk
 
 async def check_ollama_status() -> Dict[str, Any]:
     """Verifica el estado de Ollama"""
@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 def debug_generar_datos(producto_id: int = 1, n_dias: int = 180):
     """Versión simplificada para depuración."""
     print(f"Generando datos para {n_dias} días...")
+    # Un único generador (PCG64) para todos los valores aleatorios
+    rng = np.random.default_rng()
     
     # Generar fechas
     fechas = pd.date_range(
@@ -23,23 +25,28 @@ def debug_generar_datos(producto_id: int = 1, n_dias: int = 180):
     tendencia = np.linspace(10, 15, n_dias)
     print(f"Tendencia: {len(tendencia)}")
     
-    estacionalidad_semanal = 2 * np.sin(2 * np.pi * np.arange(n_dias) / 7)
+    # Ángulo base calculado una vez para ambas estacionalidades
+    angulo = 2 * np.pi * np.arange(n_dias)
+    estacionalidad_semanal = 2 * np.sin(angulo / 7)
     print(f"Estacionalidad semanal: {len(estacionalidad_semanal)}")
     
-    estacionalidad_mensual = 3 * np.sin(2 * np.pi * np.arange(n_dias) / 30)
+    estacionalidad_mensual = 3 * np.sin(angulo / 30)
     print(f"Estacionalidad mensual: {len(estacionalidad_mensual)}")
     
-    ruido = np.random.normal(0, 2, n_dias)
+    ruido = rng.normal(0, 2, n_dias)
     print(f"Ruido: {len(ruido)}")
     
     eventos = np.zeros(n_dias)
-    indices_eventos = np.random.choice(n_dias, size=int(n_dias * 0.05), replace=False)
-    eventos[indices_eventos] = np.random.uniform(5, 15, len(indices_eventos))
+    indices_eventos = rng.choice(n_dias, size=int(n_dias * 0.05), replace=False)
+    eventos[indices_eventos] = rng.uniform(5, 15, len(indices_eventos))
     print(f"Eventos: {len(eventos)}")
     
-    # Ventas finales
-    ventas_base = tendencia + estacionalidad_semanal + estacionalidad_mensual + ruido + eventos
-    ventas = np.maximum(ventas_base, 0)
+    # Ventas finales, acumuladas en un único buffer (sin un temporal por cada suma)
+    ventas = tendencia + estacionalidad_semanal
+    ventas += estacionalidad_mensual
+    ventas += ruido
+    ventas += eventos
+    np.maximum(ventas, 0, out=ventas)
     print(f"Ventas: {len(ventas)}")
     
     # Crear cada columna individualmente
@@ -48,17 +55,18 @@ def debug_generar_datos(producto_id: int = 1, n_dias: int = 180):
     # Verificar todas las longitudes antes de crear el DataFrame
     columnas = {
         'fecha': fechas,
-        'producto_id': [producto_id] * n_dias,
+        'producto_id': np.full(n_dias, producto_id, dtype=np.int32),
         'cantidad_vendida': ventas,
-        'precio_base': 100 + np.random.uniform(-20, 20, n_dias),
-        'stock_actual': np.random.randint(5, 100, n_dias),
-        'precio_proveedor_promedio': 70 + np.random.uniform(-10, 10, n_dias),
-        'dia_semana': [fecha.weekday() for fecha in fechas],
-        'mes': [fecha.month for fecha in fechas],
-        'margen': np.random.uniform(0.2, 0.4, n_dias),
-        'variacion_precio': np.random.uniform(-0.1, 0.1, n_dias),
-        'precio_competencia': 105 + np.random.uniform(-25, 25, n_dias),
-        'promocion_activa': np.random.choice([0, 1], n_dias, p=[0.8, 0.2])
+        'precio_base': 100 + rng.uniform(-20, 20, n_dias),
+        'stock_actual': rng.integers(5, 100, n_dias, dtype=np.int16),
+        'precio_proveedor_promedio': 70 + rng.uniform(-10, 10, n_dias),
+        # Atributos vectorizados del DatetimeIndex en lugar de recorrer cada fecha
+        'dia_semana': fechas.weekday.astype(np.int8),
+        'mes': fechas.month.astype(np.int8),
+        'margen': rng.uniform(0.2, 0.4, n_dias),
+        'variacion_precio': rng.uniform(-0.1, 0.1, n_dias),
+        'precio_competencia': 105 + rng.uniform(-25, 25, n_dias),
+        'promocion_activa': (rng.random(n_dias) < 0.2).astype(np.int8)
     }
     
     # Verificar longitudes
@@ -67,7 +75,15 @@ def debug_generar_datos(producto_id: int = 1, n_dias: int = 180):
     
     # Crear DataFrame
     try:
-        data = pd.DataFrame(columnas)
+        # Columnas numéricas en float32 (los enteros ya se generan con tipos estrechos)
+        data = pd.DataFrame(columnas).astype({
+            'cantidad_vendida': 'float32',
+            'precio_base': 'float32',
+            'precio_proveedor_promedio': 'float32',
+            'margen': 'float32',
+            'variacion_precio': 'float32',
+            'precio_competencia': 'float32'
+        })
         print(f"DataFrame creado exitosamente: {len(data)} filas")
         return data
     except Exception as e:
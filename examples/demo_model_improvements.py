@@ -4,13 +4,24 @@ Script de ejemplo para demostrar las mejoras implementadas en los modelos
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 import sys
 
+# Copy-on-Write: las copias superficiales sólo duplican las columnas que se
+# modifican. En pandas >= 3.0 siempre está activo y la opción está obsoleta
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
 # Agregar el directorio del proyecto al path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
+try:
+    import bottleneck as bn
+except ImportError:  # dependencia opcional: se usa rolling de pandas
+    bn = None
+
 try:
     from models.training.train_regresion import ModeloLinealMejorado, SimpleDataValidator, SimpleDataCleaner
     from models.training.train_polynomial import ModeloPolinomicoMejorado
@@ -21,6 +32,21 @@ except ImportError as e:
     print("Asegúrese de que la estructura del proyecto esté correcta")
     exit(1)
 
+@lru_cache(maxsize=8)
+def _estacionalidades(n: int):
+    """
+    Términos senoidales semanal y mensual para una serie de `n` días.
+    
+    Dependen sólo de `n`, así que se calculan una vez por longitud; se
+    devuelven como sólo lectura porque el mismo array se comparte entre llamadas.
+    """
+    angulo = 2 * np.pi * np.arange(n)
+    semanal = 2 * np.sin(angulo / 7)
+    mensual = 3 * np.sin(angulo / 30)
+    semanal.flags.writeable = False
+    mensual.flags.writeable = False
+    return semanal, mensual
+
 def generar_datos_ejemplo(producto_id: int = 1, n_dias: int = 180) -> pd.DataFrame:
     """
     Genera datos sintéticos realistas para demostración.
@@ -55,68 +81,78 @@ def generar_datos_ejemplo(producto_id: int = 1, n_dias: int = 180) -> pd.DataFra
     # Simular patrones realistas de venta
     n_real = len(fechas)  # Usar la longitud real de fechas
     
+    # Cada componente se suma en el mismo buffer `ventas`, sin arrays temporales
     # Tendencia creciente leve
-    tendencia = np.linspace(10, 15, n_real)
-    
-    # Estacionalidad semanal (más ventas en fin de semana)
-    estacionalidad_semanal = 2 * np.sin(2 * np.pi * np.arange(n_real) / 7)
+    ventas = np.linspace(10, 15, n_real)
     
-    # Estacionalidad mensual
-    estacionalidad_mensual = 3 * np.sin(2 * np.pi * np.arange(n_real) / 30)
+    # Estacionalidad semanal (más ventas en fin de semana) y mensual
+    estacionalidad_semanal, estacionalidad_mensual = _estacionalidades(n_real)
+    ventas += estacionalidad_semanal
+    ventas += estacionalidad_mensual
     
     # Ruido aleatorio
-    ruido = np.random.normal(0, 2, n_real)
+    ventas += np.random.normal(0, 2, n_real)
     
     # Eventos especiales (picos de venta ocasionales)
-    eventos = np.zeros(n_real)
     indices_eventos = np.random.choice(n_real, size=int(n_real * 0.05), replace=False)
-    eventos[indices_eventos] = np.random.uniform(5, 15, len(indices_eventos))
+    ventas[indices_eventos] += np.random.uniform(5, 15, len(indices_eventos))
     
     # Ventas finales
-    ventas_base = tendencia + estacionalidad_semanal + estacionalidad_mensual + ruido + eventos
-    ventas = np.maximum(ventas_base, 0)  # No ventas negativas
+    np.maximum(ventas, 0, out=ventas)  # No ventas negativas
     
-    # Crear DataFrame
+    # Crear DataFrame: cada columna es un ndarray con un dtype ajustado a su
+    # rango (precios en float32, enteros pequeños en int8/int16)
     data = pd.DataFrame({
         'fecha': fechas,
-        'producto_id': [producto_id] * len(fechas),  # Usar len(fechas) para estar seguros
+        'producto_id': np.full(n_real, producto_id, dtype=np.int32),
         'cantidad_vendida': ventas,
-        'precio_base': 100 + np.random.uniform(-20, 20, len(fechas)),
-        'stock_actual': np.random.randint(5, 100, len(fechas)),
-        'precio_proveedor_promedio': 70 + np.random.uniform(-10, 10, len(fechas)),
-        'dia_semana': [fecha.weekday() for fecha in fechas],
-        'mes': [fecha.month for fecha in fechas],
-        'margen': np.random.uniform(0.2, 0.4, len(fechas)),
-        'variacion_precio': np.random.uniform(-0.1, 0.1, len(fechas)),
-        'precio_competencia': 105 + np.random.uniform(-25, 25, len(fechas)),
-        'promocion_activa': np.random.choice([0, 1], len(fechas), p=[0.8, 0.2])
+        'precio_base': (100 + np.random.uniform(-20, 20, n_real)).astype(np.float32),
+        'stock_actual': np.random.randint(5, 100, n_real).astype(np.int16),
+        'precio_proveedor_promedio': (70 + np.random.uniform(-10, 10, n_real)).astype(np.float32),
+        # Atributos vectorizados del DatetimeIndex en lugar de recorrer cada fecha
+        'dia_semana': fechas.weekday.astype(np.int8),
+        'mes': fechas.month.astype(np.int8),
+        'margen': np.random.uniform(0.2, 0.4, n_real),
+        'variacion_precio': np.random.uniform(-0.1, 0.1, n_real),
+        'precio_competencia': (105 + np.random.uniform(-25, 25, n_real)).astype(np.float32),
+        'promocion_activa': np.random.choice([0, 1], n_real, p=[0.8, 0.2]).astype(np.int8)
     })
     
-    # Calcular features derivados
-    data['ventas_7_dias'] = data['cantidad_vendida'].rolling(window=7, min_periods=1).mean()
-    data['ventas_30_dias'] = data['cantidad_vendida'].rolling(window=30, min_periods=1).mean()
-    
-    # Calcular tendencia
-    def calcular_tendencia(serie):
-        if len(serie) < 2:
-            return 0
-        x = np.arange(len(serie))
-        try:
-            return np.polyfit(x, serie, 1)[0]
-        except:
-            return 0
-    
-    data['tendencia_30_dias'] = data['cantidad_vendida'].rolling(
-        window=30, min_periods=2
-    ).apply(calcular_tendencia)
-    
-    # Estacionalidad simple (promedio por día de la semana)
-    try:
-        estacionalidad = data.groupby('dia_semana')['cantidad_vendida'].transform('mean')
-        data['estacionalidad'] = estacionalidad / data['cantidad_vendida'].mean()
-    except Exception:
-        # Fallback en caso de error
-        data['estacionalidad'] = 1.0
+    # Calcular features derivados (con bottleneck, medias móviles de una pasada
+    # directamente sobre el ndarray)
+    if bn is not None:
+        cantidad_vendida = data['cantidad_vendida'].to_numpy()
+        data['ventas_7_dias'] = bn.move_mean(cantidad_vendida, 7, min_count=1)
+        data['ventas_30_dias'] = bn.move_mean(cantidad_vendida, 30, min_count=1)
+    else:
+        data['ventas_7_dias'] = data['cantidad_vendida'].rolling(window=7, min_periods=1).mean()
+        data['ventas_30_dias'] = data['cantidad_vendida'].rolling(window=30, min_periods=1).mean()
+    
+    # Calcular tendencia: pendiente de la recta de mínimos cuadrados en cada
+    # ventana (x = 0..n-1), en forma cerrada con sumas móviles en lugar de un
+    # np.polyfit por ventana:
+    #   pendiente = (n·Σxy - Σx·Σy) / (n·Σx² - (Σx)²)
+    ventas_serie = data['cantidad_vendida']
+    posicion = np.arange(len(ventas_serie), dtype=float)
+    ventana = ventas_serie.rolling(window=30, min_periods=2)
+    n = ventana.count()
+    suma_y = ventana.sum()
+    # Σxy con x relativo al inicio de cada ventana: Σ j·y_j - inicio·Σy
+    inicio = posicion - n + 1
+    suma_xy = (ventas_serie * posicion).rolling(window=30, min_periods=2).sum() - inicio * suma_y
+    suma_x = n * (n - 1) / 2
+    suma_xx = (n - 1) * n * (2 * n - 1) / 6
+    data['tendencia_30_dias'] = (n * suma_xy - suma_x * suma_y) / (n * suma_xx - suma_x ** 2)
+    
+    # Estacionalidad simple (promedio por día de la semana): las 7 medias se
+    # calculan con bincount y se reparten a cada fila indexando por el día
+    dias = data['dia_semana'].to_numpy()
+    cantidades = data['cantidad_vendida'].to_numpy()
+    medias_por_dia = (
+        np.bincount(dias, weights=cantidades, minlength=7)
+        / np.maximum(np.bincount(dias, minlength=7), 1)
+    )
+    data['estacionalidad'] = medias_por_dia[dias] / cantidades.mean()
     
     print(f"✓ Datos generados: {len(data)} registros desde {data['fecha'].min()} hasta {data['fecha'].max()}")
     return data
@@ -128,7 +164,9 @@ def demostrar_validacion_y_limpieza(data: pd.DataFrame) -> pd.DataFrame:
     print("="*60)
     
     # Introducir algunos problemas en los datos para demostración
-    data_con_problemas = data.copy()
+    # Copia superficial: con Copy-on-Write sólo se duplican las columnas en las
+    # que se inyectan NaN, sin tocar `data`
+    data_con_problemas = data.copy(deep=False)
     
     # Simular valores faltantes de forma más simple
     n_problemas = max(1, int(len(data) * 0.05))
@@ -138,15 +176,17 @@ def demostrar_validacion_y_limpieza(data: pd.DataFrame) -> pd.DataFrame:
     indices_precio = np.random.choice(len(data), size=min(5, n_problemas), replace=False)
     indices_stock = np.random.choice(len(data), size=min(3, n_problemas), replace=False)
     
-    # Introducir valores faltantes usando un bucle simple
-    for idx in indices_precio:
-        data_con_problemas.at[idx, 'precio_base'] = np.nan
+    # Introducir valores faltantes con una sola asignación por columna
+    # (stock_actual es entera: se pasa a float para poder contener NaN)
+    data_con_problemas['stock_actual'] = data_con_problemas['stock_actual'].astype(np.float64)
+    data_con_problemas.loc[indices_precio, 'precio_base'] = np.nan
+    data_con_problemas.loc[indices_stock, 'stock_actual'] = np.nan
     
-    for idx in indices_stock:
-        data_con_problemas.at[idx, 'stock_actual'] = np.nan
+    # Conteo de faltantes calculado una sola vez y reutilizado en los mensajes
+    faltantes_antes = int(data_con_problemas.isna().to_numpy().sum())
     
     print(f"Datos originales: {len(data)} registros")
-    print(f"Datos con problemas introducidos: {data_con_problemas.isnull().sum().sum()} valores faltantes")
+    print(f"Datos con problemas introducidos: {faltantes_antes} valores faltantes")
     
     # 1. Validación de datos
     print("\n1. Validando calidad de datos...")
@@ -165,8 +205,10 @@ def demostrar_validacion_y_limpieza(data: pd.DataFrame) -> pd.DataFrame:
     cleaner = SimpleDataCleaner()
     datos_limpios = cleaner.clean_data(data_con_problemas, 1)
     
-    print(f"   Antes de limpieza: {len(data_con_problemas)} registros, {data_con_problemas.isnull().sum().sum()} valores faltantes")
-    print(f"   Después de limpieza: {len(datos_limpios)} registros, {datos_limpios.isnull().sum().sum()} valores faltantes")
+    faltantes_despues = int(datos_limpios.isna().to_numpy().sum())
+    
+    print(f"   Antes de limpieza: {len(data_con_problemas)} registros, {faltantes_antes} valores faltantes")
+    print(f"   Después de limpieza: {len(datos_limpios)} registros, {faltantes_despues} valores faltantes")
     print(f"   ✓ Datos limpiados exitosamente")
     
     return datos_limpios
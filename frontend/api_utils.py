@@ -1,31 +1,81 @@
-﻿import requests
+﻿import orjson
+import requests
 import random
-from datetime import datetime, timedelta
+from datetime import datetime
+import numpy as np
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # URL base de la API
 API_BASE_URL = "http://localhost:8000/api"
 
-def get_products(skip=0, limit=1000, force_refresh=False):
+@st.cache_resource
+def get_http_session():
+    """
+    Sesión HTTP compartida por todas las páginas y sesiones de Streamlit.
+    
+    Reutiliza las conexiones keep-alive con la API entre reruns en lugar de abrir
+    una conexión TCP nueva por petición, y reintenta los fallos de conexión.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.1)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Respuestas del catálogo memorizadas entre reruns de Streamlit durante 60 s.
+# Las funciones cacheadas propagan los errores para que una respuesta fallida
+# no quede guardada en la caché. orjson decodifica los bytes del cuerpo directamente
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_products(skip, limit, business_id=None):
+    # El filtro por negocio lo aplica la API, así sólo viajan los productos necesarios
+    params = {"skip": skip, "limit": limit}
+    if business_id is not None:
+        params["business_id"] = business_id
+    response = get_http_session().get(f"{API_BASE_URL}/products/", params=params, timeout=5)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_categories():
+    response = get_http_session().get(f"{API_BASE_URL}/categories/", timeout=5)
+    response.raise_for_status()
+    return {cat["id"]: cat["nombre"] for cat in orjson.loads(response.content)}
+
+def clear_products_cache():
+    """Descarta las listas de productos memorizadas de todos los negocios."""
+    _fetch_products.clear()
+
+def get_products(skip=0, limit=1000, force_refresh=False, business_id=None):
+    """
+    Productos del catálogo, filtrados por negocio si `business_id` es un ID numérico.
+    
+    El negocio llega como argumento (normalmente st.session_state.business_id) y
+    forma parte de la clave de la caché. El valor por defecto de la sesión
+    ("Negocio001") y None se normalizan a None: devuelven todos los productos
+    y comparten una sola entrada de caché.
+    """
+    if not isinstance(business_id, int):
+        business_id = None
+    if force_refresh:
+        clear_products_cache()
     try:
-        timestamp = datetime.now().timestamp()
-        response = requests.get(f"{API_BASE_URL}/products/?skip={skip}&limit={limit}&t={timestamp}")
-        response.raise_for_status()
-        products = response.json()
-        if "business_id" in globals() and globals()["business_id"]:
-            filtered_products = [p for p in products if p.get("business_id") == globals()["business_id"]]
-            return filtered_products
-        return products
-    except requests.exceptions.RequestException as e:
+        return _fetch_products(skip, limit, business_id)
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         print(f"Error al obtener productos: {str(e)}")
         return []
 
-def get_categories():
+def get_categories(force_refresh=False):
+    if force_refresh:
+        _fetch_categories.clear()
     try:
-        response = requests.get(f"{API_BASE_URL}/categories/")
-        response.raise_for_status()
-        return {cat["id"]: cat["nombre"] for cat in response.json()}
-    except requests.exceptions.RequestException as e:
+        return _fetch_categories()
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         print(f"Error al obtener categorías: {str(e)}")
         return []
 
@@ -33,7 +83,7 @@ def generar_ventas_simuladas(cantidad=10, business_id="Negocio001"):
     """Genera ventas simuladas basadas en productos disponibles."""
     ventas = []
     start_date = datetime(2025, 8, 1)
-    productos = get_products()
+    productos = get_products(business_id=business_id)
     if not productos:
         productos = [
             {"id": 1, "nombre": "Camiseta Básica", "precio_base": 15.99, "business_id": business_id, "stock_actual": random.randint(1, 10)},
@@ -48,21 +98,30 @@ def generar_ventas_simuladas(cantidad=10, business_id="Negocio001"):
             {"id": 2, "nombre": "Smartphone X10", "precio_base": 299.99, "stock_actual": 5, "business_id": business_id},
         ]
         productos_con_stock = productos
-    for _ in range(min(cantidad, len(productos_con_stock))):
-        producto = random.choice(productos_con_stock)
-        max_vendible = min(5, producto.get("stock_actual", 0))
-        if max_vendible > 0:
-            cantidad_vendida = random.randint(1, max_vendible)
-            fecha = start_date + timedelta(days=random.randint(0, 6), hours=random.randint(0, 23))
-            precio = producto.get("precio_base", 0.0)
-            total = cantidad_vendida * precio
-            ventas.append({
-                "Producto": producto["nombre"],
-                "Cantidad": cantidad_vendida,
-                "Precio Unitario": f"${precio:.2f}",
-                "Total": f"${total:.2f}",
-                "Fecha": fecha.strftime("%Y-%m-%d %H:%M")
-            })
+    # Todas las muestras aleatorias se generan de una vez con NumPy
+    n = min(cantidad, len(productos_con_stock))
+    rng = np.random.default_rng()
+    indices = rng.integers(0, len(productos_con_stock), size=n)
+    stock = np.array([p.get("stock_actual", 0) for p in productos_con_stock], dtype=np.int64)
+    max_vendible = np.minimum(5, stock[indices])
+    cantidades = rng.integers(1, max_vendible + 1)
+    fechas = (
+        np.datetime64(start_date, "m")
+        + rng.integers(0, 7, size=n) * np.timedelta64(1, "D")
+        + rng.integers(0, 24, size=n) * np.timedelta64(1, "h")
+    )
+    fechas_txt = np.char.replace(np.datetime_as_string(fechas), "T", " ")
+    for i, cantidad_vendida, fecha in zip(indices.tolist(), cantidades.tolist(), fechas_txt.tolist()):
+        producto = productos_con_stock[i]
+        precio = producto.get("precio_base", 0.0)
+        total = cantidad_vendida * precio
+        ventas.append({
+            "Producto": producto["nombre"],
+            "Cantidad": cantidad_vendida,
+            "Precio Unitario": f"${precio:.2f}",
+            "Total": f"${total:.2f}",
+            "Fecha": fecha
+        })
     return ventas
 
 # No inicializamos ventas_simuladas aquí, lo haremos en main.py
\ No newline at end of file
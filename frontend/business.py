@@ -2,13 +2,14 @@
 import requests
 import pandas as pd
 from datetime import datetime
+from api_utils import get_http_session
 
 # URL base de la API
 API_BASE_URL = "http://localhost:8000/api"
 
 def get_businesses(skip=0, limit=100):
     try:
-        response = requests.get(f"{API_BASE_URL}/business/", params={"skip": skip, "limit": limit})
+        response = get_http_session().get(f"{API_BASE_URL}/business/", params={"skip": skip, "limit": limit}, timeout=5)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -17,7 +18,7 @@ def get_businesses(skip=0, limit=100):
 
 def get_business(business_id):
     try:
-        response = requests.get(f"{API_BASE_URL}/business/{business_id}")
+        response = get_http_session().get(f"{API_BASE_URL}/business/{business_id}", timeout=5)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -26,7 +27,7 @@ def get_business(business_id):
 
 def create_business(nombre, descripcion):
     try:
-        response = requests.post(f"{API_BASE_URL}/business/new", json={"nombre": nombre, "descripcion": descripcion})
+        response = get_http_session().post(f"{API_BASE_URL}/business/new", json={"nombre": nombre, "descripcion": descripcion}, timeout=5)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -35,7 +36,7 @@ def create_business(nombre, descripcion):
 
 def update_business(business_id, nombre, descripcion):
     try:
-        response = requests.put(f"{API_BASE_URL}/business/update/{business_id}", json={"nombre": nombre, "descripcion": descripcion})
+        response = get_http_session().put(f"{API_BASE_URL}/business/update/{business_id}", json={"nombre": nombre, "descripcion": descripcion}, timeout=5)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -44,7 +45,7 @@ def update_business(business_id, nombre, descripcion):
 
 def delete_business(business_id):
     try:
-        response = requests.delete(f"{API_BASE_URL}/business/delete/{business_id}")
+        response = get_http_session().delete(f"{API_BASE_URL}/business/delete/{business_id}", timeout=5)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -2,24 +2,32 @@
 import requests
 import pandas as pd
 from datetime import datetime
+from api_utils import get_categories, get_http_session
 
 # URL base de la API
 API_URL = "http://localhost:8000/api/categories"
 
+# Listado de categorías memorizado entre reruns durante 30 s; propaga los errores
+# para que una respuesta fallida no quede guardada en la caché
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_categories(skip, limit):
+    response = get_http_session().get(f"{API_URL}/", params={"skip": skip, "limit": limit}, timeout=5)
+    response.raise_for_status()
+    return response.json()
+
 # Función para obtener la lista de categorías
 def fetch_categories(skip=0, limit=1000):
     try:
-        response = requests.get(f"{API_URL}/", params={"skip": skip, "limit": limit})
-        response.raise_for_status()
-        return response.json()
+        return _fetch_categories(skip, limit)
     except requests.exceptions.RequestException as e:
-        st.error(f"Error al recuperar categorías: {response.status_code} - {response.text if 'text' in response.__dict__ else str(e)}")
+        detalle = f"{e.response.status_code} - {e.response.text}" if e.response is not None else str(e)
+        st.error(f"Error al recuperar categorías: {detalle}")
         return []
 
 # Función para obtener una categoría por ID
 def fetch_category(category_id):
     try:
-        response = requests.get(f"{API_URL}/{category_id}")
+        response = get_http_session().get(f"{API_URL}/{category_id}", timeout=5)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -29,8 +37,9 @@ def fetch_category(category_id):
 # Función para crear una nueva categoría
 def create_category(category_data):
     try:
-        response = requests.post(f"{API_URL}/new", json=category_data)
+        response = get_http_session().post(f"{API_URL}/new", json=category_data, timeout=5)
         response.raise_for_status()
+        _fetch_categories.clear()
         st.success("Categoría creada correctamente")
         return True
     except requests.exceptions.RequestException as e:
@@ -40,8 +49,9 @@ def create_category(category_data):
 # Función para actualizar una categoría
 def update_category(category_id, category_data):
     try:
-        response = requests.put(f"{API_URL}/update/{category_id}", json=category_data)
+        response = get_http_session().put(f"{API_URL}/update/{category_id}", json=category_data, timeout=5)
         response.raise_for_status()
+        _fetch_categories.clear()
         st.success("Categoría actualizada correctamente")
         return True
     except requests.exceptions.RequestException as e:
@@ -51,8 +61,9 @@ def update_category(category_id, category_data):
 # Función para eliminar una categoría
 def delete_category(category_id):
     try:
-        response = requests.delete(f"{API_URL}/delete/{category_id}")
+        response = get_http_session().delete(f"{API_URL}/delete/{category_id}", timeout=5)
         response.raise_for_status()
+        _fetch_categories.clear()
         st.success("Categoría eliminada correctamente")
         return True
     except requests.exceptions.RequestException as e:
@@ -90,6 +101,7 @@ def show_categories():
                 if nombre:
                     category_data = {"nombre": nombre, "descripcion": descripcion if descripcion else None}
                     if create_category(category_data):
+                        get_categories(force_refresh=True)
                         st.rerun()
                 else:
                     st.error("El nombre es obligatorio.")
@@ -108,6 +120,7 @@ def show_categories():
                         if nombre:
                             category_data = {"nombre": nombre, "descripcion": descripcion if descripcion else None}
                             if update_category(category_id, category_data):
+                                get_categories(force_refresh=True)
                                 st.rerun()
                         else:
                             st.error("El nombre es obligatorio.")
@@ -125,6 +138,7 @@ def show_categories():
                 st.warning("Esta acción no se puede deshacer.")
                 if st.form_submit_button("Eliminar"):
                     if delete_category(category_id):
+                        get_categories(force_refresh=True)
                         st.rerun()
         else:
             st.warning("No hay categorías disponibles para eliminar.")
@@ -11,6 +11,13 @@ import requests
 import json
 from datetime import datetime
 from typing import Dict, Any, List
+from requests.adapters import HTTPAdapter
+
+# Sesión HTTP compartida: reutiliza las conexiones keep-alive con el backend en
+# lugar de abrir una conexión TCP nueva por cada mensaje del chat
+_HTTP = requests.Session()
+_HTTP.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+_HTTP.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
 
 
 class ChatbotFrontend:
@@ -39,7 +46,7 @@ class ChatbotFrontend:
     def get_products_list(self) -> List[Dict[str, Any]]:
         """Obtener lista de productos del backend"""
         try:
-            response = requests.get(f"{self.backend_url}/api/products", timeout=5)
+            response = _HTTP.get(f"{self.backend_url}/api/products", timeout=5)
             if response.status_code == 200:
                 products = response.json()
                 st.session_state.products_cache = products
@@ -259,7 +266,7 @@ class ChatbotFrontend:
     def check_backend_connection(self) -> bool:
         """Verificar conexión con el backend"""
         try:
-            response = requests.get(f"{self.backend_url}/api/chatbot/health", timeout=3)
+            response = _HTTP.get(f"{self.backend_url}/api/chatbot/health", timeout=3)
             return response.status_code == 200
         except Exception:
             return False
@@ -273,7 +280,7 @@ class ChatbotFrontend:
                 "timestamp": datetime.now().isoformat()
             }
             
-            response = requests.post(
+            response = _HTTP.post(
                 f"{self.backend_url}/api/chatbot/message",
                 json=payload,
                 timeout=10
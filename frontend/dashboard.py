@@ -1,18 +1,30 @@
 ﻿import streamlit as st
-import pandas as pd
-import plotly.express as px
+import pyarrow as pa
+import plotly.graph_objects as go
 from api_utils import get_products
 from sales import get_sales
 
+# Figura de barras memorizada por contenido: los argumentos son tuplas (hashables),
+# así un rerun con los mismos datos reutiliza la figura en lugar de reconstruirla
+@st.cache_data(show_spinner=False)
+def _bar_fig(x: tuple, y: tuple, title: str, x_label: str, y_label: str, colorscale: str) -> go.Figure:
+    fig = go.Figure(go.Bar(
+        x=x,
+        y=y,
+        marker=dict(color=y, colorscale=colorscale, showscale=True, colorbar=dict(title=y_label))
+    ))
+    fig.update_layout(title=title, xaxis_title=x_label, yaxis_title=y_label)
+    return fig
+
 def show_dashboard():
     st.title(f"Dashboard - Negocio {st.session_state.business_id}")
     st.header("📦 Inventario Actual")
-    productos = get_products()
+    productos = get_products(business_id=st.session_state.business_id)
     if productos:
-        df_productos = pd.DataFrame(productos)
-        st.dataframe(df_productos, use_container_width=True)
-        fig = px.bar(df_productos, x="nombre", y="precio_base", title="Precios por Producto",
-                     color="precio_base", color_continuous_scale="Blues")
+        # La tabla se entrega a Streamlit directamente en Arrow, sin pasar por pandas
+        st.dataframe(pa.Table.from_pylist(productos), use_container_width=True)
+        fig = _bar_fig(tuple(p["nombre"] for p in productos), tuple(p["precio_base"] for p in productos),
+                       "Precios por Producto", "nombre", "precio_base", "Blues")
         st.plotly_chart(fig, use_container_width=True)
     else:
         st.info("No hay productos disponibles.")
@@ -20,14 +32,11 @@ def show_dashboard():
     st.header("📈 Ventas Recientes")
     ventas = get_sales()
     if ventas:
-        df_ventas = pd.DataFrame(ventas)
         st.subheader("Listado de Ventas")
-        st.dataframe(df_ventas, use_container_width=True)
+        st.dataframe(pa.Table.from_pylist(ventas), use_container_width=True)
         st.subheader("Gráfico de Ventas por Producto")
-        df_ventas["Total_Value"] = df_ventas["Total"].apply(lambda x: float(x.replace("$", "")))
-        fig_ventas = px.bar(df_ventas, x="Producto", y="Total_Value", title="Total de Ventas por Producto",
-                            color="Total_Value", color_continuous_scale="Viridis",
-                            labels={"Total_Value": "Total ($)", "Producto": "Producto"})
+        fig_ventas = _bar_fig(tuple(v["Producto"] for v in ventas), tuple(float(v["Total"].replace("$", "")) for v in ventas),
+                              "Total de Ventas por Producto", "Producto", "Total ($)", "Viridis")
         st.plotly_chart(fig_ventas, use_container_width=True)
     else:
         st.info("No hay ventas disponibles.")
\ No newline at end of file
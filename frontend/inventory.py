@@ -2,30 +2,38 @@
 import requests
 import pandas as pd
 from datetime import datetime
-from api_utils import get_products  # Importar desde api_utils
+from api_utils import get_products, get_http_session  # Importar desde api_utils
 
 # URL base de la API
 API_URL = "http://localhost:8000/api/inventory"
 
-# Función para obtener la lista de inventario
-def fetch_inventory(skip=0, limit=1000, min_stock=None):
+# Listado de inventario memorizado entre reruns durante 30 s; propaga los errores
+# para que una respuesta fallida no quede guardada en la caché
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_inventory(skip, limit, min_stock):
     params = {"skip": skip, "limit": limit}
     if min_stock is not None:
         params["min_stock"] = min_stock
+    response = get_http_session().get(f"{API_URL}/", params=params, timeout=5)
+    response.raise_for_status()
+    return response.json()  # Devuelve la lista de diccionarios directamente
+
+# Función para obtener la lista de inventario
+def fetch_inventory(skip=0, limit=1000, min_stock=None):
     try:
-        response = requests.get(f"{API_URL}/", params=params)
-        response.raise_for_status()
-        return response.json()  # Devuelve la lista de diccionarios directamente
+        return _fetch_inventory(skip, limit, min_stock)
     except requests.exceptions.RequestException as e:
-        st.error(f"Error al recuperar el inventario: {response.status_code} - {response.text if 'text' in response.__dict__ else str(e)}")
+        detalle = f"{e.response.status_code} - {e.response.text}" if e.response is not None else str(e)
+        st.error(f"Error al recuperar el inventario: {detalle}")
         return []
 
 # Función para crear un nuevo registro de inventario
 def create_inventory(product_id, stock_actual):
     payload = {"product_id": product_id, "stock_actual": stock_actual}
     try:
-        response = requests.post(f"{API_URL}/new", json=payload)
+        response = get_http_session().post(f"{API_URL}/new", json=payload, timeout=5)
         response.raise_for_status()
+        _fetch_inventory.clear()
         st.success("Registro de inventario creado correctamente")
         return True
     except requests.exceptions.RequestException as e:
@@ -36,8 +44,9 @@ def create_inventory(product_id, stock_actual):
 def update_inventory(inventory_id, stock_actual):
     payload = {"stock_actual": stock_actual}
     try:
-        response = requests.put(f"{API_URL}/update/{inventory_id}", json=payload)
+        response = get_http_session().put(f"{API_URL}/update/{inventory_id}", json=payload, timeout=5)
         response.raise_for_status()
+        _fetch_inventory.clear()
         st.success("Registro de inventario actualizado correctamente")
         return True
     except requests.exceptions.RequestException as e:
@@ -47,8 +56,9 @@ def update_inventory(inventory_id, stock_actual):
 # Función para eliminar un registro de inventario
 def delete_inventory(inventory_id):
     try:
-        response = requests.delete(f"{API_URL}/delete/{inventory_id}")
+        response = get_http_session().delete(f"{API_URL}/delete/{inventory_id}", timeout=5)
         response.raise_for_status()
+        _fetch_inventory.clear()
         st.success("Registro de inventario eliminado correctamente")
         return True
     except requests.exceptions.RequestException as e:
@@ -60,6 +70,10 @@ def show_inventory():
     st.markdown("Administración de inventario para el negocio seleccionado")
 
     # Pestañas para CRUD
+    # Inventario completo leído una vez y compartido por las pestañas de
+    # actualizar y eliminar (la de listar aplica sus propios filtros)
+    inventario_completo = fetch_inventory()
+    
     tab1, tab2, tab3, tab4 = st.tabs(["📋 Listar", "🛒 Crear", "✏️ Actualizar", "🗑️ Eliminar"])
 
     with tab1:
@@ -90,7 +104,7 @@ def show_inventory():
     with tab2:
         st.header("Crear Inventario de Producto")
         with st.form("form_create_inventory"):
-            productos = get_products()  # Obtener todos los productos
+            productos = get_products(business_id=st.session_state.business_id)
             if productos:
                 producto_id = st.selectbox("Seleccionar Producto", 
                                          [(p["id"], p["nombre"]) for p in productos], 
@@ -104,7 +118,7 @@ def show_inventory():
 
     with tab3:
         st.header("Actualizar Inventario de Producto")
-        inventory_data = fetch_inventory()
+        inventory_data = inventario_completo
         if inventory_data:
             inventory_id = st.selectbox("Seleccionar ID del Producto", [i["id"] for i in inventory_data])
             selected_inventory = next((i for i in inventory_data if i["id"] == inventory_id), None)
@@ -121,7 +135,7 @@ def show_inventory():
 
     with tab4:
         st.header("Eliminar Inventario")
-        inventory_data = fetch_inventory()
+        inventory_data = inventario_completo
         if inventory_data:
             with st.form("form_delete_inventory"):
                 inventory_id = st.selectbox("Seleccionar ID del Producto para Eliminar", [i["id"] for i in inventory_data])
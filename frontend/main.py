@@ -1,4 +1,5 @@
 ﻿import streamlit as st
+from pathlib import Path
 
 # Configuración inicial (primer comando)
 st.set_page_config(
@@ -7,26 +8,13 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Estilo personalizado combinado
-st.markdown("""
-    <style>
-    .main { background-color: #1A2A44; color: #E0E8F0; }
-    .stButton>button { background-color: #3498DB; color: #1A2A44; border-radius: 8px; border: none; padding: 5px 10px; font-weight: bold; vertical-align: middle; margin: 0; width: auto; box-sizing: border-box; display: inline-block; }
-    .stButton>button:hover { background-color: #5DADE2; color: #1A2A44; }
-    .stTextInput>div>input, .stNumberInput>div>input, .stSelectbox>div>select { background-color: #2B4066; color: #E0E8F0; border: 1px solid #3498DB; border-radius: 5px; }
-    h1, h2, h3 { color: #FFFFFF !important; font-family: 'Arial', sans-serif; }
-    .sidebar .sidebar-content { background-color: #2B4066; position: relative; height: 100vh; }
-    .change-business-button { position: absolute; bottom: 20px; right: 20px; }
-    .main .stDataFrame, .main .stDataFrame table { background-color: #1A2A44 !important; color: #E0E8F0 !important; border: none !important; }
-    .main .stDataFrame th, .main .stDataFrame td { background-color: #1A2A44 !important; color: #E0E8F0 !important; border: 1px solid #3498DB !important; padding: 8px; }
-    .main .stDataFrame tr { background-color: #1A2A44 !important; }
-    .main .stTabs { background-color: #1A2A44 !important; border: none !important; }
-    .main .stTabs [data-baseweb="tab"] { background-color: #2B4066 !important; color: #E0E8F0 !important; border: none !important; }
-    .main .stTabs [data-baseweb="tab"]:hover { background-color: #3498DB !important; color: #1A2A44 !important; }
-    .main .stForm { background-color: #1A2A44 !important; border: none !important; }
-    .stContainer { background-color: #1A2A44 !important; border: none !important; color: #E0E8F0 !important; }
-    </style>
-""", unsafe_allow_html=True)
+# Estilo personalizado combinado: la hoja vive en style.css y se lee una sola
+# vez por proceso, no en cada rerun del script
+@st.cache_resource
+def _css() -> str:
+    return Path(__file__).with_name("style.css").read_text(encoding="utf-8")
+
+st.markdown(f"<style>{_css()}</style>", unsafe_allow_html=True)
 
 # Importaciones después de set_page_config
 from business import show_select_business
@@ -53,16 +41,11 @@ if "ventas_simuladas" not in st.session_state:
 # Inicializar el chatbot
 chatbot = ChatbotFrontend()
 
-# Navegación principal
-if st.session_state.page == "select_business":
-    show_select_business()
-else:
-    st.sidebar.title("MicroAnalytics")
-    opcion = st.sidebar.selectbox("🖥️ Seleccionar sección", ["Dashboard", "📦 Inventario", "🛒 Productos", "💰 Ventas", "📂 Categorías", "🏭 Proveedores", "🤖 Chat"])
-    
-    if opcion == "🏭 Proveedores":
-        sub_opcion = st.sidebar.selectbox("📦 Submenú Proveedores", ["📞 Gestión de Contacto", "💰 Precios de Proveedores"])
-
+# La sección activa se ejecuta como fragmento: la interacción con sus widgets
+# sólo vuelve a ejecutar la sección, no la barra lateral ni el resto del script
+# (st.rerun() dentro de una sección sigue relanzando la app completa)
+@st.fragment
+def mostrar_seccion(opcion, sub_opcion=None):
     if opcion == "Dashboard":
         show_dashboard()
     elif opcion == "📦 Inventario":
@@ -78,8 +61,23 @@ else:
             show_supplier_contact_info()
         elif sub_opcion == "💰 Precios de Proveedores":
             show_supplier_prices()
-    elif opcion == "🤖 Chat":
+
+# Navegación principal
+if st.session_state.page == "select_business":
+    show_select_business()
+else:
+    st.sidebar.title("MicroAnalytics")
+    opcion = st.sidebar.selectbox("🖥️ Seleccionar sección", ["Dashboard", "📦 Inventario", "🛒 Productos", "💰 Ventas", "📂 Categorías", "🏭 Proveedores", "🤖 Chat"])
+    
+    sub_opcion = None
+    if opcion == "🏭 Proveedores":
+        sub_opcion = st.sidebar.selectbox("📦 Submenú Proveedores", ["📞 Gestión de Contacto", "💰 Precios de Proveedores"])
+
+    # El chat queda fuera del fragmento: usa st.chat_input y la barra lateral
+    if opcion == "🤖 Chat":
         chatbot.run()
+    else:
+        mostrar_seccion(opcion, sub_opcion)
 
 # Botón para cambiar de negocio desde cualquier sección
 if st.session_state.page != "select_business":
@@ -5,30 +5,36 @@ import plotly.express as px
 import time
 import json
 from datetime import datetime
-from api_utils import get_products, get_categories  # Importar desde api_utils
+from api_utils import get_products, get_categories, get_http_session  # Importar desde api_utils
 from inventory import create_inventory  # Mantener esta importación, ahora segura
 
 # URL base de la API (opcional, ya en api_utils)
 API_BASE_URL = "http://localhost:8000/api"
 
+# Detalle de producto memorizado entre reruns durante 30 s; propaga los errores
+# para que una respuesta fallida no quede guardada en la caché
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_product(product_id):
+    response = get_http_session().get(f"{API_BASE_URL}/products/{product_id}", timeout=5)
+    response.raise_for_status()
+    return response.json()
+
 def get_product(product_id):
     try:
-        response = requests.get(f"{API_BASE_URL}/products/{product_id}")
-        response.raise_for_status()
-        return response.json()
+        return _fetch_product(product_id)
     except requests.exceptions.RequestException as e:
         st.error(f"Error al obtener producto: {str(e)}")
         return None
 
 def create_product(nombre, descripcion, precio_base, category_id, business_id):
     try:
-        response = requests.post(f"{API_BASE_URL}/products/new", json={
+        response = get_http_session().post(f"{API_BASE_URL}/products/new", json={
             "nombre": nombre,
             "descripcion": descripcion,
             "precio_base": precio_base,
             "category_id": category_id,
             "business_id": business_id
-        })
+        }, timeout=5)
         response.raise_for_status()
         new_product = response.json()
         print(f"Respuesta de creación de producto (raw): {json.dumps(new_product, indent=2)}")
@@ -53,8 +59,9 @@ def update_product(product_id, nombre=None, descripcion=None, precio_base=None,
             "category_id": category_id,
             "business_id": business_id
         }.items() if v is not None}
-        response = requests.put(f"{API_BASE_URL}/products/update/{product_id}", json=payload)
+        response = get_http_session().put(f"{API_BASE_URL}/products/update/{product_id}", json=payload, timeout=5)
         response.raise_for_status()
+        _fetch_product.clear()
         return response.json()
     except requests.exceptions.RequestException as e:
         st.error(f"Error al actualizar producto: {str(e)}")
@@ -62,8 +69,9 @@ def update_product(product_id, nombre=None, descripcion=None, precio_base=None,
 
 def delete_product(product_id):
     try:
-        response = requests.delete(f"{API_BASE_URL}/products/delete/{product_id}")
+        response = get_http_session().delete(f"{API_BASE_URL}/products/delete/{product_id}", timeout=5)
         response.raise_for_status()
+        _fetch_product.clear()
         return response.json()
     except requests.exceptions.RequestException as e:
         st.error(f"Error al eliminar producto: {str(e)}")
@@ -73,6 +81,9 @@ def delete_product(product_id):
 def show_products():
     st.title(f"Product Management - Negocio {st.session_state.business_id}")
     
+    # Una sola lectura de productos por rerun, compartida por todas las pestañas
+    productos = get_products(business_id=st.session_state.business_id)
+    
     tab1, tab2, tab3, tab4 = st.tabs(["🛍️ Agregar", "✏️ Actualizar", "🗑️ Eliminar", "📋 Listar"])
     
     with tab1:
@@ -88,7 +99,7 @@ def show_products():
                     new_product = create_product(nombre, descripcion, precio_base, category_id, business_id)
                     if new_product:
                         st.success(f"Producto creado exitosamente: {nombre}")
-                        get_products(force_refresh=True)
+                        get_products(force_refresh=True, business_id=st.session_state.business_id)
                         time.sleep(4)
                         st.rerun()
                     else:
@@ -98,7 +109,6 @@ def show_products():
     
     with tab2:
         st.header("Actualizar Producto")
-        productos = get_products()
         if productos:
             producto_id = st.selectbox("Seleccionar un producto", 
                                       [(p["id"], p["nombre"]) for p in productos], 
@@ -115,6 +125,7 @@ def show_products():
                         updated_product = update_product(producto_id[0], nombre_update, descripcion_update, precio_base_update, category_id_update, business_id_update)
                         if updated_product:
                             st.success(f"Producto actualizado exitosamente: {nombre_update}")
+                            get_products(force_refresh=True, business_id=st.session_state.business_id)
                             st.rerun()
                         else:
                             st.error("Error al actualizar el producto.")
@@ -125,7 +136,6 @@ def show_products():
     
     with tab3:
         st.header("Eliminar Producto")
-        productos = get_products()
         if productos:
             producto_id_delete = st.selectbox("Seleccionar un producto para eliminar", 
                                             [(p["id"], p["nombre"]) for p in productos], 
@@ -134,6 +144,7 @@ def show_products():
                 deleted_product = delete_product(producto_id_delete[0])
                 if deleted_product:
                     st.success(f"Producto eliminado exitosamente: {producto_id_delete[1]}")
+                    get_products(force_refresh=True, business_id=st.session_state.business_id)
                     st.rerun()
                 else:
                     st.error("Error al eliminar el producto.")
@@ -143,6 +154,8 @@ def show_products():
     with tab4:
         st.header("Lista de Productos")
         if st.button("Refresh"):
+            get_products(force_refresh=True, business_id=st.session_state.business_id)
+            get_categories(force_refresh=True)
             st.rerun()
         # Filtros
         col1, col2 = st.columns(2)
@@ -154,7 +167,7 @@ def show_products():
             selected_category = st.selectbox("Filtrar por Categoría", options=list(categories.keys()), format_func=lambda x: categories.get(x, "Sin nombre"))
 
         # Aplicar filtros
-        filtered_products = get_products()
+        filtered_products = productos
         if filtered_products:
             if product_id_filter > 0:
                 filtered_products = [p for p in filtered_products if p["id"] == product_id_filter]
@@ -1,26 +1,10 @@
 ﻿import streamlit as st
 import pandas as pd
-import requests
+import pyarrow as pa
 from datetime import datetime, timedelta
 import random
 from inventory import fetch_inventory, update_inventory
-from api_utils import get_products
-
-@st.cache_data
-def get_products_from_api():
-    API_BASE_URL = "http://localhost:8000/api"
-    try:
-        timestamp = datetime.now().timestamp()
-        response = requests.get(f"{API_BASE_URL}/products/?skip=0&limit=1000&t={timestamp}")
-        response.raise_for_status()
-        products = response.json()
-        if st.session_state.business_id:
-            filtered_products = [p for p in products if p.get("business_id") == st.session_state.business_id]
-            return filtered_products
-        return products
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error al obtener productos: {str(e)}")
-        return []
+from api_utils import clear_products_cache, get_products
 
 def get_inventory_for_product(product_id):
     inventory = fetch_inventory()
@@ -33,7 +17,8 @@ def get_sales():
 def show_sales():
     st.title(f"Sales Management - Negocio {st.session_state.business_id}")
     
-    productos = get_products_from_api()
+    # El filtro por negocio lo aplica la API: sólo viajan los productos del negocio
+    productos = get_products(business_id=st.session_state.business_id)
     if not productos:
         productos = [
             {"id": 1, "nombre": "Camiseta Básica", "precio_base": 15.99, "business_id": st.session_state.business_id or "Negocio001"},
@@ -42,25 +27,33 @@ def show_sales():
             {"id": 4, "nombre": "Auriculares Bluetooth", "precio_base": 29.99, "business_id": st.session_state.business_id or "Negocio001"},
         ]
 
+    # Inventario indexado por producto con una sola petición (reversed conserva
+    # el primer registro de cada producto, como get_inventory_for_product)
     inventario = fetch_inventory()
+    inventario_por_producto = {item.get("product_id"): item for item in reversed(inventario)}
     for producto in productos:
-        inv = get_inventory_for_product(producto["id"])
+        inv = inventario_por_producto.get(producto["id"])
         if inv:
             producto["stock_actual"] = inv["stock_actual"]
         else:
             producto["stock_actual"] = random.randint(1, 10)
 
+    productos_por_id = {p["id"]: p for p in productos}
+
     tab1, tab2 = st.tabs(["💸 Agregar", "📊 Mostrar"])
     
     with tab1:
         st.header("Registrar Venta")
+        if st.button("Refrescar productos"):
+            clear_products_cache()
+            st.rerun()
         if productos:
             with st.form("form_registrar_venta"):
                 producto_id = st.selectbox("Seleccionar un producto", 
                                           [(p["id"], p["nombre"]) for p in productos], 
                                           format_func=lambda x: x[1])
                 cantidad = st.number_input("Cantidad", min_value=1, step=1)
-                producto_seleccionado = next(p for p in productos if p["id"] == producto_id[0])
+                producto_seleccionado = productos_por_id[producto_id[0]]
                 stock_actual = producto_seleccionado.get("stock_actual", 0)
                 st.write(f"Stock disponible: {stock_actual}")
                 if st.form_submit_button("Registrar"):
@@ -76,6 +69,8 @@ def show_sales():
                                 "Fecha": datetime.now().strftime("%Y-%m-%d %H:%M")
                             }
                             st.session_state.ventas_simuladas.append(nueva_venta)
+                            # El stock cambia con la venta: la lista cacheada ya no vale
+                            clear_products_cache()
                             inv = get_inventory_for_product(producto_id[0])
                             if inv:
                                 nuevo_stock = inv["stock_actual"] - cantidad
@@ -97,8 +92,8 @@ def show_sales():
         st.header("Lista de Ventas")
         ventas = st.session_state.ventas_simuladas
         if ventas:
+            st.dataframe(pa.Table.from_pylist(ventas), use_container_width=True)
             df_ventas = pd.DataFrame(ventas)
-            st.dataframe(df_ventas, use_container_width=True)
             st.subheader("Total de Ventas por Producto")
             try:
                 df_ventas["Total_Value"] = df_ventas["Total"].apply(lambda x: float(x.replace("$", "")))
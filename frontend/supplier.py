@@ -2,6 +2,7 @@
 import requests
 import pandas as pd
 from datetime import datetime
+from api_utils import get_http_session
 
 # URL base de la API
 API_URL = "http://localhost:8000/api/suppliers"
@@ -9,7 +10,7 @@ API_URL = "http://localhost:8000/api/suppliers"
 # Función para obtener la lista de proveedores
 def fetch_suppliers(skip=0, limit=100):
     try:
-        response = requests.get(f"{API_URL}/", params={"skip": skip, "limit": limit})
+        response = get_http_session().get(f"{API_URL}/", params={"skip": skip, "limit": limit}, timeout=5)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -19,7 +20,7 @@ def fetch_suppliers(skip=0, limit=100):
 # Función para obtener un proveedor por ID
 def fetch_supplier(supplier_id):
     try:
-        response = requests.get(f"{API_URL}/{supplier_id}")
+        response = get_http_session().get(f"{API_URL}/{supplier_id}", timeout=5)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -29,7 +30,7 @@ def fetch_supplier(supplier_id):
 # Función para crear un nuevo proveedor
 def create_supplier(nombre, contacto):
     try:
-        response = requests.post(f"{API_URL}/new", json={"nombre": nombre, "contacto": contacto if contacto else None})
+        response = get_http_session().post(f"{API_URL}/new", json={"nombre": nombre, "contacto": contacto if contacto else None}, timeout=5)
         response.raise_for_status()
         st.success("Proveedor creado correctamente")
         return True
@@ -41,7 +42,7 @@ def create_supplier(nombre, contacto):
 def update_supplier(supplier_id, nombre=None, contacto=None):
     try:
         payload = {k: v for k, v in {"nombre": nombre, "contacto": contacto}.items() if v is not None}
-        response = requests.put(f"{API_URL}/update/{supplier_id}", json=payload)
+        response = get_http_session().put(f"{API_URL}/update/{supplier_id}", json=payload, timeout=5)
         response.raise_for_status()
         st.success("Proveedor actualizado correctamente")
         return True
@@ -52,7 +53,7 @@ def update_supplier(supplier_id, nombre=None, contacto=None):
 # Función para eliminar un proveedor
 def delete_supplier(supplier_id):
     try:
-        response = requests.delete(f"{API_URL}/delete/{supplier_id}")
+        response = get_http_session().delete(f"{API_URL}/delete/{supplier_id}", timeout=5)
         response.raise_for_status()
         st.success("Proveedor eliminado correctamente")
         return True
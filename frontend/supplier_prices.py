@@ -2,6 +2,7 @@
 import requests
 import pandas as pd
 from datetime import datetime
+from api_utils import get_http_session
 
 # URL base de la API
 API_URL = "http://localhost:8000/api/supplier-prices"
@@ -14,7 +15,7 @@ def fetch_supplier_prices(skip=0, limit=100, product_id=None, supplier_id=None):
             params["product_id"] = product_id
         if supplier_id:
             params["supplier_id"] = supplier_id
-        response = requests.get(f"{API_URL}/", params=params)
+        response = get_http_session().get(f"{API_URL}/", params=params, timeout=5)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -24,7 +25,7 @@ def fetch_supplier_prices(skip=0, limit=100, product_id=None, supplier_id=None):
 # Función para obtener un precio por ID
 def fetch_supplier_price(price_id):
     try:
-        response = requests.get(f"{API_URL}/{price_id}/details")
+        response = get_http_session().get(f"{API_URL}/{price_id}/details", timeout=5)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -34,7 +35,7 @@ def fetch_supplier_price(price_id):
 # Función para crear un nuevo precio
 def create_supplier_price(product_id, supplier_id, precio):
     try:
-        response = requests.post(f"{API_URL}/", json={"product_id": product_id, "supplier_id": supplier_id, "precio": precio})
+        response = get_http_session().post(f"{API_URL}/", json={"product_id": product_id, "supplier_id": supplier_id, "precio": precio}, timeout=5)
         response.raise_for_status()
         st.success("Precio creado correctamente")
         return True
@@ -45,7 +46,7 @@ def create_supplier_price(product_id, supplier_id, precio):
 # Función para actualizar un precio
 def update_supplier_price(price_id, precio):
     try:
-        response = requests.put(f"{API_URL}/{price_id}", json={"precio": precio})
+        response = get_http_session().put(f"{API_URL}/{price_id}", json={"precio": precio}, timeout=5)
         response.raise_for_status()
         st.success("Precio actualizado correctamente")
         return True
@@ -56,7 +57,7 @@ def update_supplier_price(price_id, precio):
 # Función para eliminar un precio
 def delete_supplier_price(price_id):
     try:
-        response = requests.delete(f"{API_URL}/{price_id}")
+        response = get_http_session().delete(f"{API_URL}/{price_id}", timeout=5)
         response.raise_for_status()
         st.success("Precio eliminado correctamente")
         return True
@@ -48,7 +48,7 @@ class ModelPredictor:
         # Verificar caché de predicción
         if use_cache:
             cached_result = model_cache.get_cached_prediction(
-                self.producto_id, "all_models", dias_adelante
+                self.producto_id, "all_models", dias_adelante, include_confidence
             )
             if cached_result is not None:
                 model_logger.logger.info(
@@ -139,8 +139,8 @@ class ModelPredictor:
         
         # Guardar en caché
         if use_cache:
-            model_cache.cache_prediction(
-                result, self.producto_id, "all_models", dias_adelante
+            model_cache.cache_model_prediction(
+                result, self.producto_id, "all_models", dias_adelante, include_confidence
             )
         
         # Log de rendimiento
@@ -512,7 +512,8 @@ def predict_demanda(producto_id: int, dias_adelante: int) -> List[float]:
         predictor = ModelPredictor(producto_id)
         
         # Intentar obtener predicción con mejor modelo disponible
-        result = predictor.predict_all_models(dias_adelante, use_cache=True)
+        # dias_adelante por nombre: validate_prediction_input sólo lo lee de kwargs
+        result = predictor.predict_all_models(dias_adelante=dias_adelante, use_cache=True)
         
         if result and 'best_prediction' in result and result['best_prediction']:
             return result['best_prediction'].get('prediction', [])
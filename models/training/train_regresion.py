@@ -235,15 +235,23 @@ class ModeloLinealMejorado:
             
             if 'tendencia_30_dias' not in data.columns:
                 # Calcular tendencia como la pendiente de los últimos 30 días
+                # Pendiente de mínimos cuadrados con sumas directas (x = 0..n-1),
+                # sin el ajuste por SVD de np.polyfit en cada ventana
                 def calculate_trend(series):
-                    if len(series) < 2:
+                    n = len(series)
+                    if n < 2:
                         return 0
-                    x = np.arange(len(series))
-                    return np.polyfit(x, series, 1)[0]
+                    x = np.arange(n)
+                    sum_x = n * (n - 1) / 2
+                    sum_xx = (n - 1) * n * (2 * n - 1) / 6
+                    sum_y = series.sum()
+                    sum_xy = x @ series
+                    return (n * sum_xy - sum_x * sum_y) / (n * sum_xx - sum_x * sum_x)
                 
+                # raw=True entrega cada ventana como ndarray, sin construir una Series
                 data['tendencia_30_dias'] = data['cantidad_vendida'].rolling(
                     window=30, min_periods=2
-                ).apply(calculate_trend)
+                ).apply(calculate_trend, raw=True)
             
             # Rellenar valores faltantes con métodos apropiados
             data['estacionalidad'] = data.get('estacionalidad', 1.0)
@@ -386,7 +386,8 @@ class ModelCacheMejorado:
         except Exception as e:
             return {'error': f'Error en limpieza: {e}'}
     
-    def get_cached_prediction(self, producto_id: int, model_type: str, dias_adelante: int) -> Optional[Dict]:
+    def get_cached_prediction(self, producto_id: int, model_type: str, dias_adelante: int,
+                              include_confidence: bool = True) -> Optional[Dict]:
         """
         Obtiene una predicción desde el caché si existe y es válida.
         
@@ -394,20 +395,42 @@ class ModelCacheMejorado:
             producto_id: ID del producto
             model_type: Tipo de modelo
             dias_adelante: Días de predicción
+            include_confidence: Si la predicción incluye métricas de confianza
             
         Returns:
             Resultado de predicción si existe en caché, None en caso contrario
         """
         try:
-            # Generar hash para la búsqueda
-            input_hash = hashlib.md5(f"{producto_id}_{model_type}_{dias_adelante}".encode()).hexdigest()
-            
-            # Usar el método load_prediction existente
-            return self.load_prediction(producto_id, input_hash, max_age_days=self.max_cache_age_days)
+            # Usar el método load_prediction existente con la misma clave que
+            # cache_model_prediction
+            input_hash = self._prediction_hash(
+                producto_id, model_type, dias_adelante, include_confidence
+            )
+            return self.load_prediction(producto_id, input_hash)
             
         except Exception:
             return None
 
+    def cache_model_prediction(self, prediction: Any, producto_id: int, model_type: str,
+                               dias_adelante: int, include_confidence: bool = True) -> Optional[str]:
+        """
+        Cachea una predicción de modo que get_cached_prediction la encuentre.
+        
+        Args:
+            prediction: Resultado de la predicción
+            producto_id: ID del producto
+            model_type: Tipo de modelo
+            dias_adelante: Días de predicción
+            include_confidence: Si la predicción incluye métricas de confianza
+            
+        Returns:
+            str: ID del caché de predicción
+        """
+        input_hash = self._prediction_hash(
+            producto_id, model_type, dias_adelante, include_confidence
+        )
+        return self.cache_prediction(prediction, producto_id, input_hash)
+
     def get_cached_model(self, producto_id: int, model_type: str, data=None, force_retrain: bool = False):
         """
         Obtiene un modelo desde el caché si existe y es válido.
@@ -432,6 +455,13 @@ class ModelCacheMejorado:
             return None
 
     # Métodos helper privados
+    def _prediction_hash(self, producto_id: int, model_type: str, dias_adelante: int,
+                         include_confidence: bool = True) -> str:
+        """Hash de entrada con el que se guarda y se busca una predicción."""
+        # Cada opción que cambia la forma del resultado forma parte de la clave
+        key = f"{producto_id}_{model_type}_{dias_adelante}_{int(include_confidence)}"
+        return hashlib.md5(key.encode()).hexdigest()
+    
     def _generate_cache_id(self, producto_id: int, model_type: str, version: str) -> str:
         """Genera un ID único para el caché."""
         base_string = f"{producto_id}_{model_type}_{version}"
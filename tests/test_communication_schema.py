@@ -0,0 +1,47 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import pytest
+
+from chatbot.communication_schema import MessageProcessor
+
+
+def _clasificar_original(message: str) -> str:
+    """Clasificador anterior a la precompilación, como referencia"""
+    message_lower = message.lower()
+    prediction_keywords = ['predic', 'demanda', 'forecast', 'estima', 'proyecc']
+    comparison_keywords = ['compar', 'modelo', 'mejor', 'evalua', 'rendimiento']
+    inventory_keywords = ['inventario', 'stock', 'almacen', 'existencia']
+    analysis_keywords = ['analiz', 'tendencia', 'reporte', 'estadistica']
+    scores = {
+        'prediction': sum(1 for keyword in prediction_keywords if keyword in message_lower),
+        'comparison': sum(1 for keyword in comparison_keywords if keyword in message_lower),
+        'inventory': sum(1 for keyword in inventory_keywords if keyword in message_lower),
+        'analysis': sum(1 for keyword in analysis_keywords if keyword in message_lower)
+    }
+    max_intent = max(scores, key=scores.get)
+    return max_intent if scores[max_intent] else "general"
+
+
+@pytest.mark.parametrize("message", [
+    "Predice la demanda del producto 5 para 7 días",
+    "Compara el rendimiento de cada modelo",
+    "¿Cuánto stock queda en el inventario?",
+    "Analiza la tendencia del reporte",
+    "Hola, ¿qué tal?",
+    # Palabras clave solapadas entre intenciones y dentro de una misma intención
+    "predicompar",
+    "predicompar modelo",
+    "comparendimiento predic demanda",
+    "stockanaliz tendencia inventario",
+    "PREDICOMPARENDIMIENTO",
+])
+def test_classify_intent_matches_original(message):
+    assert MessageProcessor.classify_intent(message).intent == _clasificar_original(message)
+
+
+def test_overlapping_keywords_all_count():
+    # "compar" y "rendimiento" comparten la "r": ambas suman a la confianza
+    message = "comparendimiento " + " ".join(["palabra"] * 19)
+    result = MessageProcessor.classify_intent(message)
+    assert result.intent == "comparison"
+    assert result.confidence == pytest.approx(2 / 20 * 5)
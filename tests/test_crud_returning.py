@@ -0,0 +1,107 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.base import Base, get_db
+from backend.models import Business, Category, Inventory, Product, Supplier, SupplierPrice
+from backend.crud import inventory_crud, product_crud, supplier_crud, supplier_price_crud, transaction_detail_crud
+from backend.routes import product_routes
+from backend.schemas.inventory_schema import InventoryUpdate
+from backend.schemas.product_schema import ProductUpdate
+from backend.schemas.supplier_schema import SupplierUpdate
+
+MISSING_ID = 9999
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    with factory() as db:
+        db.add_all([
+            Business(id=1, nombre="Negocio"),
+            Category(id=1, nombre="Ropa"),
+            Product(id=1, business_id=1, category_id=1, nombre="Camiseta", precio_base=10),
+            Inventory(id=1, product_id=1, stock_actual=5),
+            Supplier(id=1, nombre="Proveedor"),
+            SupplierPrice(id=1, product_id=1, supplier_id=1, precio=8),
+        ])
+        db.commit()
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def db(session_factory):
+    with session_factory() as session:
+        yield session
+
+
+def test_update_product_returns_updated_row(db):
+    updated = product_crud.update_product(db, 1, ProductUpdate(nombre="Polo"))
+    assert updated.id == 1
+    assert updated.nombre == "Polo"
+    assert product_crud.get_product(db, 1).nombre == "Polo"
+
+
+def test_update_product_not_found(db):
+    assert product_crud.update_product(db, MISSING_ID, ProductUpdate(nombre="Polo")) is None
+
+
+def test_update_inventory_not_found(db):
+    assert inventory_crud.update_inventory(db, MISSING_ID, InventoryUpdate(stock_actual=1)) is None
+
+
+def test_delete_inventory_returns_product_name(db):
+    deleted = inventory_crud.delete_inventory(db, 1)
+    assert deleted["id"] == 1
+    assert deleted["stock_actual"] == 5
+    assert deleted["product_name"] == "Camiseta"
+    assert inventory_crud.get_inventory(db, 1) is None
+
+
+def test_delete_inventory_not_found(db):
+    assert inventory_crud.delete_inventory(db, MISSING_ID) is None
+
+
+def test_update_supplier_not_found(db):
+    assert supplier_crud.update_supplier(db, MISSING_ID, SupplierUpdate(nombre="Otro")) is None
+
+
+def test_delete_supplier_detaches_prices(db):
+    assert supplier_crud.delete_supplier(db, 1).id == 1
+    assert db.get(SupplierPrice, 1).supplier_id is None
+
+
+def test_delete_supplier_not_found_keeps_prices(db):
+    assert supplier_crud.delete_supplier(db, MISSING_ID) is None
+    assert supplier_price_crud.get_supplier_price(db, 1).supplier_id == 1
+
+
+def test_delete_supplier_price_not_found(db):
+    assert supplier_price_crud.delete_supplier_price(db, MISSING_ID) is None
+
+
+def test_delete_transaction_detail_not_found(db):
+    assert transaction_detail_crud.delete_transaction_detail(db, MISSING_ID) is False
+
+
+def test_update_product_route_not_found(session_factory):
+    app = FastAPI()
+    app.include_router(product_routes.router, prefix="/api")
+
+    def override_get_db():
+        with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    client = TestClient(app)
+
+    response = client.put(f"/api/products/update/{MISSING_ID}", json={"nombre": "Polo"})
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Product not found"
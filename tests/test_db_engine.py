@@ -0,0 +1,43 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import QueuePool
+
+from backend.base import POOL_OPTIONS, _connect_args, _pool_options
+
+
+@pytest.mark.parametrize("url", [
+    "sqlite://",
+    "sqlite:///:memory:",
+    "sqlite:///file:memdb?mode=memory&uri=true",
+])
+def test_in_memory_sqlite_engines(url):
+    engine = create_engine(url, connect_args=_connect_args(url), **_pool_options(url))
+    with engine.connect() as conn:
+        assert conn.scalar(text("SELECT 1")) == 1
+    engine.dispose()
+
+
+def test_in_memory_aiosqlite_engine():
+    url = "sqlite+aiosqlite:///:memory:"
+    engine = create_async_engine(url, connect_args=_connect_args(url), **_pool_options(url))
+
+    async def select_one():
+        async with engine.connect() as conn:
+            return await conn.scalar(text("SELECT 1"))
+
+    assert asyncio.run(select_one()) == 1
+    asyncio.run(engine.dispose())
+
+
+def test_file_sqlite_keeps_queue_pool(tmp_path):
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    assert _pool_options(url) == POOL_OPTIONS
+    engine = create_engine(url, connect_args=_connect_args(url), **_pool_options(url))
+    assert isinstance(engine.pool, QueuePool)
+    assert engine.pool.size() == POOL_OPTIONS["pool_size"]
+    engine.dispose()
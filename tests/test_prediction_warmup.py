@@ -0,0 +1,66 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+import models.predict as predict_module
+from backend.routes import prediction_routes
+from models.utils.model_cache import ModelCacheMejorado
+
+
+def _datos_historicos(producto_id: int, n_dias: int = 60) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    fechas = pd.date_range(end=datetime.now() - timedelta(days=1), periods=n_dias, freq="D")
+    cantidad = rng.integers(5, 20, n_dias).astype(float)
+    return pd.DataFrame({
+        "fecha": fechas,
+        "producto_id": producto_id,
+        "cantidad_vendida": cantidad,
+        "dia_semana": fechas.weekday,
+        "mes": fechas.month,
+        "precio_base": 100 + rng.normal(0, 5, n_dias),
+        "stock_actual": rng.integers(50, 100, n_dias),
+        "precio_proveedor_promedio": 80 + rng.normal(0, 3, n_dias),
+        "ventas_7_dias": pd.Series(cantidad).rolling(7, min_periods=1).mean(),
+        "ventas_30_dias": pd.Series(cantidad).rolling(30, min_periods=1).mean(),
+        "margen": rng.uniform(0.1, 0.3, n_dias),
+        "variacion_precio": rng.uniform(-0.05, 0.05, n_dias),
+    })
+
+
+def test_warm_prediction_cache_populates_cache(monkeypatch, tmp_path):
+    cache = ModelCacheMejorado(base_path=str(tmp_path))
+    monkeypatch.setattr(predict_module, "model_cache", cache)
+    monkeypatch.setattr(predict_module, "obtener_datos_enriquecidos", _datos_historicos)
+    monkeypatch.setattr(prediction_routes, "get_top_selling_product_ids", lambda db, limit: [1])
+
+    assert cache.get_cached_prediction(1, "all_models", prediction_routes.PREDICTION_WARMUP_DAYS) is None
+
+    warmed = asyncio.run(prediction_routes.warm_prediction_cache(top_n=1))
+
+    assert warmed == [1]
+    cached = cache.get_cached_prediction(1, "all_models", prediction_routes.PREDICTION_WARMUP_DAYS)
+    assert cached is not None
+    assert len(cached["best_prediction"]["prediction"]) == prediction_routes.PREDICTION_WARMUP_DAYS
+
+
+def test_warm_prediction_cache_disabled():
+    assert asyncio.run(prediction_routes.warm_prediction_cache(top_n=0)) == []
+
+
+def test_prediction_cache_key_includes_confidence(monkeypatch, tmp_path):
+    cache = ModelCacheMejorado(base_path=str(tmp_path))
+    monkeypatch.setattr(predict_module, "model_cache", cache)
+    monkeypatch.setattr(predict_module, "obtener_datos_enriquecidos", _datos_historicos)
+
+    predictor = predict_module.ModelPredictor(1)
+    sin_confianza = predictor.predict_all_models(dias_adelante=7, include_confidence=False)
+    assert sin_confianza["model_performances"] == {}
+
+    con_confianza = predictor.predict_all_models(dias_adelante=7, include_confidence=True)
+    assert con_confianza["model_performances"]
+    assert cache.get_cached_prediction(1, "all_models", 7, include_confidence=False)["model_performances"] == {}
+    assert cache.get_cached_prediction(1, "all_models", 7, include_confidence=True)["model_performances"]
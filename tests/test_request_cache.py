@@ -0,0 +1,57 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import asyncio
+
+from backend.request_cache import _request_cache, clear_request_cache, request_cached
+
+calls = []
+
+
+@request_cached
+async def _read(db, item_id, extra=None):
+    calls.append((item_id, extra))
+    return {"id": item_id}
+
+
+def _run_in_request(coro_factory):
+    async def scoped():
+        token = _request_cache.set({})
+        try:
+            return await coro_factory()
+        finally:
+            _request_cache.reset(token)
+    return asyncio.run(scoped())
+
+
+def test_memoizes_within_request():
+    calls.clear()
+
+    async def body():
+        first = await _read(object(), 1)
+        # La sesión no forma parte de la clave; posicional y por nombre coinciden
+        second = await _read(object(), item_id=1)
+        await _read(object(), 2)
+        return first, second
+
+    first, second = _run_in_request(body)
+    assert first is second
+    assert calls == [(1, None), (2, None)]
+
+
+def test_clear_request_cache():
+    calls.clear()
+
+    async def body():
+        await _read(None, 1)
+        clear_request_cache()
+        await _read(None, 1)
+
+    _run_in_request(body)
+    assert calls == [(1, None), (1, None)]
+
+
+def test_no_cache_outside_request():
+    calls.clear()
+    asyncio.run(_read(None, 1))
+    asyncio.run(_read(None, 1))
+    assert calls == [(1, None), (1, None)]
@@ -0,0 +1,65 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.base import Base
+from backend.models import TransactionDetail
+from backend.routes import transaction_detail_routes
+
+N_DETAILS = 5
+
+
+class _TrackedSession(Session):
+    closed = 0
+
+    def close(self):
+        _TrackedSession.closed += 1
+        super().close()
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(TransactionDetail.__table__.insert(), [
+            {"id": i, "transaction_id": 1, "product_id": i, "cantidad": i, "precio_unitario": 1}
+            for i in range(1, N_DETAILS + 1)
+        ])
+    factory = sessionmaker(bind=engine, class_=_TrackedSession)
+    monkeypatch.setattr(transaction_detail_routes, "SessionLocal", factory)
+    _TrackedSession.closed = 0
+    yield factory
+    engine.dispose()
+
+
+def test_list_streams_all_rows(session_factory):
+    app = FastAPI()
+    app.include_router(transaction_detail_routes.router, prefix="/api")
+
+    response = TestClient(app).get("/api/transaction-details/", params={"limit": 3})
+    assert response.status_code == 200
+    assert [d["id"] for d in response.json()] == [1, 2, 3]
+    assert _TrackedSession.closed == 1
+
+
+def test_stream_session_closed_when_client_disconnects(session_factory):
+    response = transaction_detail_routes.read_transaction_details(
+        skip=0, limit=N_DETAILS, transaction_id=None, product_id=None
+    )
+
+    async def read_first_chunk():
+        body = response.body_iterator
+        assert await body.__anext__() == b"["
+        assert _TrackedSession.closed == 0
+        # Equivale a la cancelación del cuerpo cuando el cliente se desconecta
+        await body.aclose()
+
+    asyncio.run(read_first_chunk())
+    assert _TrackedSession.closed == 1
@@ -0,0 +1,182 @@
+import sys, os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from backend.base import Base, get_async_db
+from backend.models import Business, Transaction
+from backend.request_cache import RequestCacheMiddleware
+from backend.routes import transaction_routes
+
+N_TRANSACTIONS = 5
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    db_path = tmp_path / "test.db"
+    engine = create_engine(f"sqlite:///{db_path}", poolclass=NullPool)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(Business.__table__.insert(), [{"id": 1, "nombre": "A"}, {"id": 2, "nombre": "B"}])
+        conn.execute(Transaction.__table__.insert(), [
+            {"id": i, "business_id": 1 if i % 2 else 2, "total": 10 * i}
+            for i in range(1, N_TRANSACTIONS + 1)
+        ])
+    engine.dispose()
+
+    # NullPool: cada petición del TestClient abre su conexión en el bucle que la usa
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+    session_factory = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+    monkeypatch.setattr(transaction_routes, "AsyncSessionLocal", session_factory)
+    transaction_routes._transaction_cache.clear()
+
+    async def override_get_async_db():
+        async with session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.add_middleware(RequestCacheMiddleware)
+    app.include_router(transaction_routes.router, prefix="/api")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    yield TestClient(app)
+    transaction_routes._transaction_cache.clear()
+
+
+def test_list_envelope_and_cursor(client):
+    first = client.get("/api/transactions/", params={"limit": 2}).json()
+    assert [t["id"] for t in first["items"]] == [5, 4]
+    assert first["total"] == N_TRANSACTIONS
+    assert first["size"] == 2
+    assert first["next_cursor"] == 4
+
+    second = client.get("/api/transactions/", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+    assert [t["id"] for t in second["items"]] == [3, 2]
+    assert second["next_cursor"] == 2
+
+    last = client.get("/api/transactions/", params={"limit": 2, "cursor": second["next_cursor"]}).json()
+    assert [t["id"] for t in last["items"]] == [1]
+    assert last["next_cursor"] is None
+
+
+def test_list_empty_page(client):
+    page = client.get("/api/transactions/", params={"cursor": 1}).json()
+    assert page == {"items": [], "total": N_TRANSACTIONS, "size": 100, "next_cursor": None}
+
+
+def test_list_filters_by_business(client):
+    page = client.get("/api/transactions/", params={"business_id": 2, "limit": 1}).json()
+    assert [t["id"] for t in page["items"]] == [4]
+    assert page["total"] == 2
+    assert page["next_cursor"] == 4
+
+    page = client.get("/api/transactions/", params={"business_id": 2, "limit": 1, "cursor": 4}).json()
+    assert [t["id"] for t in page["items"]] == [2]
+
+
+def test_read_transaction_etag_and_not_modified(client):
+    response = client.get("/api/transactions/3")
+    assert response.status_code == 200
+    assert response.json()["id"] == 3
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    assert response.headers["cache-control"] == "private, max-age=30"
+
+    revalidated = client.get("/api/transactions/3", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+
+
+def test_read_transaction_if_none_match_lists(client):
+    etag = client.get("/api/transactions/3").headers["etag"]
+    strong = etag.removeprefix("W/")
+
+    for header in (f'"otro", {etag}', f'W/"otro",{strong}', "*"):
+        response = client.get("/api/transactions/3", headers={"If-None-Match": header})
+        assert response.status_code == 304, header
+
+    response = client.get("/api/transactions/3", headers={"If-None-Match": '"otro", W/"mas"'})
+    assert response.status_code == 200
+
+
+def test_read_transaction_not_found(client):
+    assert client.get("/api/transactions/999").status_code == 404
+
+
+def test_update_invalidates_cached_body(client):
+    etag = client.get("/api/transactions/3").headers["etag"]
+
+    response = client.put("/api/transactions/update/3", json={"total": 99.5})
+    assert response.status_code == 200
+    assert response.json()["total"] == 99.5
+
+    response = client.get("/api/transactions/3", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["total"] == 99.5
+
+
+def test_delete_invalidates_cached_body(client):
+    assert client.get("/api/transactions/3").status_code == 200
+    assert client.delete("/api/transactions/delete/3").status_code == 200
+    assert client.get("/api/transactions/3").status_code == 404
+
+
+def test_update_and_delete_not_found(client):
+    response = client.put("/api/transactions/update/999", json={"total": 1})
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Transaction not found"
+    assert client.delete("/api/transactions/delete/999").status_code == 404
+
+
+def test_shared_cache_bypasses_local_cache(client, monkeypatch):
+    store = {}
+
+    async def cache_get(key):
+        return store.get(key)
+
+    async def cache_set(key, value):
+        store[key] = value
+
+    async def cache_delete(key):
+        store.pop(key, None)
+
+    shared_cache = transaction_routes.shared_cache
+    monkeypatch.setattr(shared_cache, "is_enabled", lambda: True)
+    monkeypatch.setattr(shared_cache, "cache_get", cache_get)
+    monkeypatch.setattr(shared_cache, "cache_set", cache_set)
+    monkeypatch.setattr(shared_cache, "cache_delete", cache_delete)
+
+    assert client.get("/api/transactions/3").status_code == 200
+    assert "tx:3" in store
+    assert 3 not in transaction_routes._transaction_cache
+
+    # Otro worker guarda en Redis una versión nueva: este no debe seguir
+    # sirviendo su copia local
+    store["tx:3"] = store["tx:3"].replace(b'"total":30.0', b'"total":42.0')
+    assert client.get("/api/transactions/3").json()["total"] == 42
+
+    assert client.put("/api/transactions/update/3", json={"total": 7}).status_code == 200
+    assert "tx:3" not in store
+
+
+def test_bulk_create_returns_rows_in_order(client):
+    payload = [{"business_id": 1, "total": 1.5}, {"business_id": 2, "total": 2.5}, {"business_id": 1, "total": 3.5}]
+    response = client.post("/api/transactions/bulk", json=payload)
+    assert response.status_code == 201
+    created = response.json()
+    assert [t["total"] for t in created] == [1.5, 2.5, 3.5]
+    assert [t["id"] for t in created] == [6, 7, 8]
+
+    page = client.get("/api/transactions/", params={"limit": 3}).json()
+    assert [t["id"] for t in page["items"]] == [8, 7, 6]
+    assert page["total"] == N_TRANSACTIONS + 3
+
+
+def test_bulk_create_empty(client):
+    response = client.post("/api/transactions/bulk", json=[])
+    assert response.status_code == 201
+    assert response.json() == []